@@ -17,9 +17,23 @@ Example:
     matches = get_tournament_matches(11593, "mens-australian-open-2026")
 """
 
-from psa_squash_rankings.api_scraper import get_rankings, get_player_bio
-from psa_squash_rankings.html_scraper import scrape_rankings_html
-from psa_squash_rankings.exporter import export_to_csv
+from psa_squash_rankings.api_scraper import (
+    get_rankings,
+    get_player_bio,
+    iter_ranking_pages,
+    make_api_session,
+)
+from psa_squash_rankings.html_scraper import (
+    clear_html_cache,
+    make_html_session,
+    scrape_rankings_html,
+)
+from psa_squash_rankings.exporter import (
+    export_to_csv,
+    export_pages_to_csv,
+    records_to_frame,
+    concat_pages,
+)
 from psa_squash_rankings.squashinfo_scraper import (
     get_recent_tournaments,
     get_tournament_matches,
@@ -50,8 +64,15 @@ __version__ = "1.0.0"
 __all__ = [
     "get_rankings",
     "get_player_bio",
+    "iter_ranking_pages",
+    "make_api_session",
+    "make_html_session",
     "scrape_rankings_html",
+    "clear_html_cache",
     "export_to_csv",
+    "export_pages_to_csv",
+    "records_to_frame",
+    "concat_pages",
     "get_recent_tournaments",
     "get_tournament_matches",
     "get_player_recent_matches",
@@ -6,12 +6,18 @@ Returns ApiPlayerRecord objects with complete player information.
 """
 
 import os
+import contextlib
 import re
 import html
 import json
+import math
+import logging
 import itertools
+import threading
+import time
 import requests
-from typing import Literal, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Literal, Any, Generator, Iterator, Optional
 from psa_squash_rankings.data_parser import parse_api_player, parse_measure
 from psa_squash_rankings.logger import get_logger
 from psa_squash_rankings.schema import ApiPlayerRecord, PsaPlayerBioRecord
@@ -19,40 +25,116 @@ from psa_squash_rankings.config import (
     API_BASE_URL,
     PSA_PLAYER_URL,
     API_TIMEOUT,
+    API_MAX_WORKERS,
     USER_AGENTS,
     CHECKPOINT_DIR,
+    CHECKPOINT_EVERY_N_PAGES,
+    RATE_LIMIT_MAX_WAIT,
+    make_session,
 )
 
 
-USER_AGENT_CYCLE = itertools.cycle(USER_AGENTS)
+logger = get_logger(__name__)
+
+# Compact encoder reused for every checkpoint record; json.dumps with
+# non-default options builds a new JSONEncoder on each call.
+_CHECKPOINT_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def _checkpoint_paths(gender: str) -> tuple[str, str]:
+    """
+    Return the (metadata, players) checkpoint paths for a gender.
+
+    CHECKPOINT_DIR is read at call time so it can still be patched.
+    """
+    base = os.fspath(CHECKPOINT_DIR / f"{gender}_checkpoint")
+    return base + ".json", base + ".jsonl"
+
+
+def _write_checkpoint_meta(gender: str, page: int, total_players: int) -> None:
+    """
+    Write the small checkpoint metadata file describing the player log.
+
+    Written to a temporary file and renamed into place, so a crash mid-write
+    leaves the previous metadata intact.
+    """
+    meta = {"gender": gender, "last_page": page, "total_players": total_players}
+    meta_file = _checkpoint_paths(gender)[0]
+    tmp_file = meta_file + ".tmp"
+    with open(tmp_file, "w") as f:
+        f.write(_CHECKPOINT_ENCODER.encode(meta))
+    os.replace(tmp_file, meta_file)
+
+
+def _write_checkpoint_players(
+    gender: str, records: list[ApiPlayerRecord], mode: str
+) -> None:
+    """
+    Write player records to the checkpoint log, one JSON object per line.
+
+    A full rewrite (mode 'w') goes through a temporary file renamed into
+    place, so a crash mid-write leaves the previous log, and with it the
+    previous checkpoint, loadable. Appends write to the log directly; the
+    metadata's player count makes a torn tail harmless.
+    """
+    players_file = _checkpoint_paths(gender)[1]
+    target = players_file + ".tmp" if mode == "w" else players_file
+    try:
+        with open(target, mode, buffering=1 << 16) as f:
+            encode = _CHECKPOINT_ENCODER.encode
+            f.writelines(encode(record) + "\n" for record in records)
+    except BaseException:
+        if target != players_file:
+            with contextlib.suppress(OSError):
+                os.remove(target)
+        raise
+    if target != players_file:
+        os.replace(target, players_file)
 
 
 def save_checkpoint(gender: str, page: int, data: list[ApiPlayerRecord]) -> None:
     """
-    Save a checkpoint of the current scraping progress.
+    Save a full checkpoint of the current scraping progress.
+
+    Players are written one per line to {gender}_checkpoint.jsonl and the
+    progress metadata to {gender}_checkpoint.json. Use append_checkpoint to
+    add later pages without rewriting the players already saved.
 
     Parameters:
     - gender: 'male' or 'female'
     - page: current page number
     - data: list of ApiPlayerRecord dictionaries collected so far
     """
-    logger = get_logger(__name__)
+    try:
+        _write_checkpoint_players(gender, data, "w")
+        _write_checkpoint_meta(gender, page, len(data))
+        logger.info("Checkpoint saved: %d players, page %d", len(data), page)
+    except Exception as e:
+        logger.error("Failed to save checkpoint: %s", e)
+        raise
 
-    checkpoint_file = CHECKPOINT_DIR / f"{gender}_checkpoint.json"
 
-    checkpoint_data = {
-        "gender": gender,
-        "last_page": page,
-        "total_players": len(data),
-        "players": data,
-    }
+def append_checkpoint(
+    gender: str, page: int, records: list[ApiPlayerRecord], total_players: int
+) -> None:
+    """
+    Append newly scraped players to an existing checkpoint.
+
+    The players are appended before the metadata is updated, so an
+    interrupted append leaves the previous checkpoint loadable.
 
+    Parameters:
+    - gender: 'male' or 'female'
+    - page: current page number
+    - records: ApiPlayerRecord dictionaries scraped since the last checkpoint
+    - total_players: number of players collected so far, including records
+    """
     try:
-        with open(checkpoint_file, "w") as f:
-            json.dump(checkpoint_data, f, indent=2)
-        logger.info(f"Checkpoint saved: {len(data)} players, page {page}")
+        _write_checkpoint_players(gender, records, "a")
+        _write_checkpoint_meta(gender, page, total_players)
+        logger.info("Checkpoint saved: %d players, page %d", total_players, page)
     except Exception as e:
-        logger.error(f"Failed to save checkpoint: {e}")
+        logger.error("Failed to save checkpoint: %s", e)
         raise
 
 
@@ -60,202 +142,638 @@ def load_checkpoint(gender: str) -> Optional[dict[str, Any]]:
     """
     Load a checkpoint for resumable scraping.
 
+    Only the number of players recorded in the metadata is read back, so
+    lines left behind by an interrupted append are ignored. A checkpoint in
+    the older single-file format, with the players embedded in the .json
+    file and no .jsonl log, is still loaded.
+
     Returns:
     - dict with 'last_page' and 'players' if checkpoint exists
     - None if no checkpoint found
     """
-    logger = get_logger(__name__)
-    checkpoint_file = CHECKPOINT_DIR / f"{gender}_checkpoint.json"
+    meta_file, players_file = _checkpoint_paths(gender)
 
-    if checkpoint_file.exists():
+    if os.path.exists(meta_file):
         try:
-            with open(checkpoint_file, "r") as f:
+            with open(meta_file, "r") as f:
                 data = json.load(f)
+
+            total = data["total_players"]
+            players: list[ApiPlayerRecord] = []
+            if "players" in data and not os.path.exists(players_file):
+                # Single-file checkpoint written before the player log
+                # existed; the next checkpoint save converts it
+                players = data["players"]
+            elif total:
+                with open(players_file, "r") as f:
+                    players = [json.loads(line) for line in itertools.islice(f, total)]
+            if len(players) != total:
+                raise ValueError(
+                    f"expected {total} players in {os.path.basename(players_file)}, "
+                    f"found {len(players)}"
+                )
+            data["players"] = players
+
             logger.info(
-                f"Resuming from checkpoint: {data['total_players']} players, page {data['last_page']}"
+                "Resuming from checkpoint: %d players, page %d",
+                data["total_players"],
+                data["last_page"],
             )
             return data
         except Exception as e:
-            logger.error(f"Failed to load checkpoint: {e}")
+            logger.error("Failed to load checkpoint: %s", e)
             return None
 
-    logger.debug(f"No checkpoint found for {gender}")
+    logger.debug("No checkpoint found for %s", gender)
     return None
 
 
 def clear_checkpoint(gender: str) -> None:
     """
-    Remove checkpoint file after successful completion.
+    Remove checkpoint files after successful completion.
     """
-    logger = get_logger(__name__)
-
-    checkpoint_file = CHECKPOINT_DIR / f"{gender}_checkpoint.json"
-    if checkpoint_file.exists():
+    meta_file, players_file = _checkpoint_paths(gender)
+    if os.path.exists(meta_file) or os.path.exists(players_file):
         try:
-            checkpoint_file.unlink()
-            logger.info(f"Checkpoint cleared for {gender}")
+            for path in (meta_file, players_file):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+            logger.info("Checkpoint cleared for %s", gender)
         except Exception as e:
-            logger.error(f"Failed to clear checkpoint: {e}")
+            logger.error("Failed to clear checkpoint: %s", e)
 
 
-def get_rankings(
-    gender: Literal["male", "female"] = "male",
-    page_size: int = 100,
-    max_pages: Optional[int] = None,
-    resume: bool = True,
-) -> list[ApiPlayerRecord]:
+class _RateLimiter:
     """
-    Fetches PSA rankings for a specific gender with pagination support.
+    Pause page fetches when the API reports its rate-limit budget is spent.
 
-    Parameters:
-    - gender: 'male' or 'female'
-    - page_size: number of results per page (default 100)
-    - max_pages: maximum number of pages to fetch (None = all)
-    - resume: whether to resume from checkpoint if available
+    Shared by the worker threads of one scrape. A response with
+    X-RateLimit-Remaining: 0 (or a Retry-After header) blocks every later
+    request until the advertised reset time, capped at RATE_LIMIT_MAX_WAIT
+    seconds. Retrying the 429 itself is left to the session's Retry policy.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def wait(self) -> None:
+        """Block until the current rate-limit window allows another request."""
+        with self._lock:
+            delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            logger.info("Rate limit reached - waiting %.1fs", delay)
+            time.sleep(delay)
+
+    def update(self, headers: Any) -> None:
+        """Record the rate-limit state advertised by a response's headers."""
+        delay = _header_number(headers, "Retry-After")
+        if delay is None and _header_number(headers, "X-RateLimit-Remaining") == 0:
+            delay = _header_number(headers, "X-RateLimit-Reset")
+            if delay is not None and delay > 1_000_000_000:
+                # Reset given as a Unix timestamp rather than seconds remaining
+                delay -= time.time()
+        if delay is None or delay <= 0:
+            return
+
+        with self._lock:
+            self._resume_at = max(
+                self._resume_at, time.monotonic() + min(delay, RATE_LIMIT_MAX_WAIT)
+            )
+
+
+def _header_number(headers: Any, name: str) -> Optional[float]:
+    """Read a finite numeric response header, returning None if absent or malformed."""
+    value = headers.get(name)
+    if not isinstance(value, str):
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return number if math.isfinite(number) else None
+
+
+# Envelope fields and headers that announce the result size, in order of preference
+_PAGE_COUNT_FIELDS = ("totalPages", "pageCount")
+_TOTAL_FIELDS = ("total", "totalCount")
+_PAGE_COUNT_HEADERS = ("X-Total-Pages",)
+_TOTAL_HEADERS = ("X-Total-Count",)
+
+
+def _last_page_from(
+    raw_data: dict[str, Any], headers: Any, page_size: int
+) -> Optional[int]:
+    """
+    Derive the last page number from the response body or headers.
 
     Returns:
-    - list[ApiPlayerRecord]: Complete player records with IDs and biographical data
+    - The last page number, or None if the response does not report its size
+    """
+    for field in _PAGE_COUNT_FIELDS:
+        value = raw_data.get(field)
+        if isinstance(value, int):
+            logger.debug("Page count from '%s' field: %s", field, value)
+            return value
+    for field in _TOTAL_FIELDS:
+        value = raw_data.get(field)
+        if isinstance(value, int):
+            logger.debug("Player total from '%s' field: %s", field, value)
+            return math.ceil(value / page_size)
+    for name in _PAGE_COUNT_HEADERS:
+        value = _header_number(headers, name)
+        if value is not None:
+            logger.debug("Page count from %s header: %s", name, value)
+            return int(value)
+    for name in _TOTAL_HEADERS:
+        value = _header_number(headers, name)
+        if value is not None:
+            logger.debug("Player total from %s header: %s", name, value)
+            return math.ceil(value / page_size)
+
+    logger.debug("Response does not report its size; paging until hasMore is false")
+    return None
+
+
+def _fetch_page(
+    session: requests.Session,
+    gender: str,
+    url: str,
+    page: int,
+    page_size: int,
+    limiter: Optional[_RateLimiter] = None,
+) -> tuple[list[dict[str, Any]], bool, Optional[int]]:
+    """
+    Fetch a single rankings page and unwrap the API envelope.
+
+    Safe to call from worker threads: the User-Agent is sent per request
+    instead of being written to the shared session headers.
+
+    Returns:
+    - (players, has_more, last_page) where last_page is derived from the
+      API's page count or total (body fields or X-Total-* headers), or None
+      if the response does not report either
 
     Raises:
     - requests.exceptions.RequestException: On network or API errors
     - ValueError: On invalid API response format
     """
-    logger = get_logger(__name__)
+    # Indexed by page rather than a shared cycle so concurrent fetches don't race.
+    user_agent = USER_AGENTS[page % len(USER_AGENTS)]
 
-    logger.info(
-        f"Starting {gender} rankings scrape (page_size={page_size}, max_pages={max_pages}, resume={resume})"
-    )
+    logger.info("Fetching %s rankings - Page %d...", gender, page)
+    logger.debug("Request URL: %s", url)
+    logger.debug("User-Agent: %s", user_agent)
 
-    all_players: list[ApiPlayerRecord] = []
-    start_page = 1
+    if limiter:
+        limiter.wait()
 
-    if resume:
-        checkpoint = load_checkpoint(gender)
-        if checkpoint:
-            all_players = checkpoint["players"]
-            start_page = checkpoint["last_page"] + 1
-            logger.info(f"Resuming scrape from page {start_page}")
+    try:
+        response = session.get(
+            url, headers={"User-Agent": user_agent}, timeout=API_TIMEOUT
+        )
+        if limiter:
+            limiter.update(response.headers)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        # Transient failures were already retried by the session's adapter
+        logger.error("%s on page %d after retries: %s", type(e).__name__, page, e)
+        raise
 
-    base_url = f"{API_BASE_URL}/{gender}"
+    raw_data = response.json()
+    if logger.isEnabledFor(logging.DEBUG):
+        # requests advertises every encoding urllib3 can decode (gzip, deflate,
+        # and br/zstd when those libraries are installed); confirm what was used.
+        logger.debug(
+            "Content-Encoding: %s",
+            response.headers.get("Content-Encoding", "identity"),
+        )
+        logger.debug(
+            "Response keys: %s",
+            raw_data.keys() if isinstance(raw_data, dict) else "list response",
+        )
+
+    last_page: Optional[int] = None
+
+    if isinstance(raw_data, dict):
+        if "players" not in raw_data:
+            raise ValueError(
+                f"API response missing required 'players' key. "
+                f"Got keys: {list(raw_data.keys())}"
+            )
 
+        players_data = raw_data["players"]
+
+        if "hasMore" not in raw_data:
+            raise ValueError(
+                f"API response missing required 'hasMore' key. "
+                f"Cannot determine pagination state. Got keys: {list(raw_data.keys())}"
+            )
+
+        has_more = raw_data["hasMore"]
+
+        last_page = _last_page_from(raw_data, response.headers, page_size)
+
+    elif isinstance(raw_data, list):
+        players_data = raw_data
+        has_more = False
+        logger.warning(
+            "API returned a list instead of dict - assuming complete dataset"
+        )
+    else:
+        raise ValueError(
+            f"Unexpected API response type: {type(raw_data).__name__}. "
+            f"Expected dict or list."
+        )
+
+    return players_data, has_more, last_page
+
+
+def _is_last_page(
+    players_data: list[dict[str, Any]], has_more: bool, page_size: int
+) -> bool:
+    """Check whether a fetched page ends the scrape, logging the reason."""
+    if not has_more:
+        logger.info("API indicates no more pages (hasMore=False)")
+        return True
+
+    if len(players_data) < page_size:
+        logger.info(
+            "Received %d players (less than page_size=%d), assuming last page",
+            len(players_data),
+            page_size,
+        )
+        return True
+
+    return False
+
+
+def _raise_if_stopped(stop: Optional[threading.Event]) -> None:
+    """Interrupt a scrape between pages once its stop event is set."""
+    if stop is not None and stop.is_set():
+        raise KeyboardInterrupt("scrape stopped")
+
+
+def _iter_pages(
+    session: requests.Session,
+    gender: str,
+    start_page: int,
+    page_size: int,
+    max_pages: Optional[int],
+    stop: Optional[threading.Event] = None,
+) -> Iterator[tuple[int, list[dict[str, Any]]]]:
+    """
+    Yield (page, raw players) for each non-empty rankings page, in page order.
+
+    Pages are fetched one at a time until a response reports the total
+    number of pages (or players), with the next page requested before the
+    current one is yielded so its fetch overlaps with the caller's parsing
+    and checkpointing. Once the last page is known, the remaining pages are
+    requested concurrently (bounded by API_MAX_WORKERS) and yielded in page
+    order, so no page past the end of the rankings is requested. hasMore
+    still has the last word: if the last reported page is full and says
+    there is more, a warning is logged and the scrape carries on page by
+    page, ignoring the reported size from then on.
+
+    Setting stop makes the next page boundary raise KeyboardInterrupt, so a
+    scrape running in a worker thread winds down as if interrupted.
+    """
+    # Only the page number varies between requests
+    url_template = f"{API_BASE_URL}/{gender}?page=%d&pageSize={page_size}"
+    page = start_page
+    last_page: Optional[int] = None
+    # Cleared once the reported size proves wrong; hasMore alone then decides
+    trust_size = True
+    # Last page yielded; it was full and not marked as the end
+    full_page = start_page - 1
+    limiter = _RateLimiter()
+
+    def fetch(p: int) -> tuple[list[dict[str, Any]], bool, Optional[int]]:
+        return _fetch_page(session, gender, url_template % p, p, page_size, limiter)
+
+    while True:
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            pending: Optional[Future] = None
+            try:
+                while last_page is None:
+                    if pending is None:
+                        if max_pages and page > max_pages:
+                            logger.info("Reached maximum page limit: %d", max_pages)
+                            return
+                        pending = prefetcher.submit(fetch, page)
+
+                    _raise_if_stopped(stop)
+                    players_data, has_more, reported_last_page = pending.result()
+                    pending = None
+                    if trust_size:
+                        last_page = reported_last_page
+
+                    if not players_data:
+                        logger.info("No more data returned on page %d", page)
+                        return
+
+                    is_last = _is_last_page(players_data, has_more, page_size)
+                    # Only prefetch a page the sequential loop would request anyway
+                    if (
+                        last_page is None
+                        and not is_last
+                        and not (max_pages and page >= max_pages)
+                    ):
+                        pending = prefetcher.submit(fetch, page + 1)
+
+                    yield page, players_data
+                    full_page = page
+
+                    if is_last:
+                        return
+
+                    page += 1
+            finally:
+                if pending is not None:
+                    pending.cancel()
+
+        reported_last_page = last_page
+        if max_pages and max_pages < last_page:
+            logger.info("Limiting scrape to maximum page limit: %d", max_pages)
+            last_page = max_pages
+
+        pages = range(page, last_page + 1)
+        if pages:
+            logger.info("Fetching pages %d-%d concurrently", page, last_page)
+
+            with ThreadPoolExecutor(
+                max_workers=min(API_MAX_WORKERS, len(pages))
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _fetch_page,
+                        session,
+                        gender,
+                        url_template % p,
+                        p,
+                        page_size,
+                        limiter,
+                    )
+                    for p in pages
+                ]
+                try:
+                    for p, future in zip(pages, futures):
+                        _raise_if_stopped(stop)
+                        players_data, has_more, _ = future.result()
+
+                        if not players_data:
+                            logger.info("No more data returned on page %d", p)
+                            return
+
+                        yield p, players_data
+                        full_page = p
+
+                        if _is_last_page(players_data, has_more, page_size):
+                            return
+                finally:
+                    for future in futures:
+                        future.cancel()
+
+        if max_pages and last_page >= max_pages:
+            return
+
+        # The last reported page was full and still had more: the size was
+        # stale or wrong, so keep going one page at a time on hasMore alone.
+        logger.warning(
+            "API reported %d pages of %s rankings but page %d was full with "
+            "hasMore=True; continuing page by page",
+            reported_last_page,
+            gender,
+            full_page,
+        )
+        trust_size = False
+        page = max(page, last_page + 1)
+        last_page = None
+
+
+def make_api_session() -> requests.Session:
+    """
+    Create a pooled session for the rankings API, honouring HTTP(S)_PROXY.
+
+    Pass the session to get_rankings or iter_ranking_pages to reuse its
+    connections across several scrapes (e.g. both genders). The caller is
+    responsible for closing it.
+    """
     proxy_url = os.getenv("HTTP_PROXY") or os.getenv("HTTPS_PROXY")
     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
 
     if proxies:
-        logger.debug(f"Using proxy: {proxy_url}")
+        logger.debug("Using proxy: %s", proxy_url)
 
-    session = requests.Session()
+    session = make_session()
     session.headers.update({"Accept": "application/json"})
 
     if proxies:
         session.proxies.update(proxies)
 
-    page = start_page
+    return session
+
+
+def iter_ranking_pages(
+    gender: Literal["male", "female"] = "male",
+    page_size: int = 100,
+    max_pages: Optional[int] = None,
+    session: Optional[requests.Session] = None,
+    stop: Optional[threading.Event] = None,
+) -> Generator[list[ApiPlayerRecord], None, None]:
+    """
+    Yield PSA rankings one parsed page at a time.
+
+    Unlike get_rankings, pages are not accumulated and no checkpoints are
+    written, so memory stays bounded by page_size. Consumers that need one
+    DataFrame should collect per-page frames and combine them once with
+    exporter.concat_pages rather than concatenating page by page.
+
+    Parameters:
+    - gender: 'male' or 'female'
+    - page_size: number of results per page (default 100)
+    - max_pages: maximum number of pages to fetch (None = all)
+    - session: session from make_api_session to reuse; left open when given
+    - stop: event that, once set, raises KeyboardInterrupt at the next page
+      (for scrapes running in worker threads, which never see Ctrl-C)
+
+    Returns:
+    - Generator of list[ApiPlayerRecord], one list per page in ranking order
+
+    Raises:
+    - requests.exceptions.RequestException: On network or API errors
+    - ValueError: On invalid API response format
+    """
+    owns_session = session is None
+    if session is None:
+        session = make_api_session()
 
     try:
-        while True:
-            if max_pages and page > max_pages:
-                logger.info(f"Reached maximum page limit: {max_pages}")
-                break
+        for _, players_data in _iter_pages(
+            session, gender, 1, page_size, max_pages, stop
+        ):
+            yield [parse_api_player(player) for player in players_data]
+    finally:
+        if owns_session:
+            session.close()
 
-            url = f"{base_url}?page={page}&pageSize={page_size}"
 
-            session.headers["User-Agent"] = next(USER_AGENT_CYCLE)
+def _flush_checkpoint(
+    gender: str,
+    page: int,
+    all_players: list[ApiPlayerRecord],
+    saved_count: Optional[int],
+) -> int:
+    """
+    Persist the players collected since the last checkpoint.
 
-            logger.info(f"Fetching {gender} rankings - Page {page}...")
-            logger.debug(f"Request URL: {url}")
-            logger.debug(f"User-Agent: {session.headers['User-Agent']}")
+    Parameters:
+    - saved_count: players already checkpointed by this run, or None to
+      write a full checkpoint
 
-            try:
-                response = session.get(url, timeout=API_TIMEOUT)
-                response.raise_for_status()
-            except requests.exceptions.Timeout:
-                logger.error(f"Request timeout on page {page}")
-                raise
-            except requests.exceptions.HTTPError as e:
-                logger.error(f"HTTP error on page {page}: {e}")
-                raise
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Request error on page {page}: {e}")
-                raise
-
-            raw_data = response.json()
-            logger.debug(
-                f"Response keys: {raw_data.keys() if isinstance(raw_data, dict) else 'list response'}"
-            )
+    Returns:
+    - Number of players now saved in the checkpoint
+    """
+    if saved_count is None:
+        save_checkpoint(gender, page, all_players)
+    else:
+        append_checkpoint(gender, page, all_players[saved_count:], len(all_players))
+    return len(all_players)
 
-            if isinstance(raw_data, dict):
-                if "players" not in raw_data:
-                    raise ValueError(
-                        f"API response missing required 'players' key. "
-                        f"Got keys: {list(raw_data.keys())}"
-                    )
 
-                players_data = raw_data["players"]
+def get_rankings(
+    gender: Literal["male", "female"] = "male",
+    page_size: int = 100,
+    max_pages: Optional[int] = None,
+    resume: bool = True,
+    session: Optional[requests.Session] = None,
+    checkpoint_every: Optional[int] = None,
+    stop: Optional[threading.Event] = None,
+) -> list[ApiPlayerRecord]:
+    """
+    Fetches PSA rankings for a specific gender with pagination support.
+
+    When the API reports the total number of players, pages after the first
+    are fetched concurrently; otherwise pages are fetched sequentially until
+    the API signals the end of the rankings.
 
-                if "hasMore" not in raw_data:
-                    raise ValueError(
-                        f"API response missing required 'hasMore' key. "
-                        f"Cannot determine pagination state. Got keys: {list(raw_data.keys())}"
-                    )
+    Parameters:
+    - gender: 'male' or 'female'
+    - page_size: number of results per page (default 100)
+    - max_pages: maximum number of pages to fetch (None = all)
+    - resume: whether to resume from checkpoint if available
+    - session: session from make_api_session to reuse; left open when given
+    - checkpoint_every: pages fetched between checkpoint writes, at least 1
+      (default: CHECKPOINT_EVERY_N_PAGES); progress is also saved when a
+      scrape fails
+    - stop: event that, once set, raises KeyboardInterrupt at the next page
+      after checkpointing (for scrapes running in worker threads)
 
-                has_more = raw_data["hasMore"]
+    Returns:
+    - list[ApiPlayerRecord]: Complete player records with IDs and biographical data
 
-            elif isinstance(raw_data, list):
-                players_data = raw_data
-                has_more = False
-                logger.warning(
-                    "API returned a list instead of dict - assuming complete dataset"
-                )
-            else:
-                raise ValueError(
-                    f"Unexpected API response type: {type(raw_data).__name__}. "
-                    f"Expected dict or list."
-                )
+    Raises:
+    - requests.exceptions.RequestException: On network or API errors
+    - ValueError: On invalid API response format, or checkpoint_every below 1
+    """
+    if checkpoint_every is None:
+        checkpoint_every = CHECKPOINT_EVERY_N_PAGES
+    if checkpoint_every < 1:
+        raise ValueError(f"checkpoint_every must be at least 1, got {checkpoint_every}")
+
+    logger.info(
+        "Starting %s rankings scrape (page_size=%d, max_pages=%s, resume=%s)",
+        gender,
+        page_size,
+        max_pages,
+        resume,
+    )
 
-            if not players_data:
-                logger.info(f"No more data returned on page {page}")
-                break
+    all_players: list[ApiPlayerRecord] = []
+    start_page = 1
 
+    if resume:
+        checkpoint = load_checkpoint(gender)
+        if checkpoint:
+            all_players = checkpoint["players"]
+            start_page = checkpoint["last_page"] + 1
+            logger.info("Resuming scrape from page %d", start_page)
+
+    owns_session = session is None
+    if session is None:
+        session = make_api_session()
+
+    # Last page whose players were parsed and added; only these may be saved
+    completed_page = start_page - 1
+    # Last page covered by a checkpoint on disk (0 if there is none)
+    checkpoint_page = completed_page
+    # Players already persisted by this run; None until the first checkpoint,
+    # which rewrites the log and discards anything left by an interrupted run.
+    saved_count: Optional[int] = None
+    pages_since_checkpoint = 0
+
+    try:
+        for page, players_data in _iter_pages(
+            session, gender, start_page, page_size, max_pages, stop
+        ):
             parsed_players = [parse_api_player(player) for player in players_data]
             all_players.extend(parsed_players)
+            completed_page = page
 
             logger.info(
-                f"Fetched {len(parsed_players)} players (Total so far: {len(all_players)})"
+                "Fetched %d players (Total so far: %d)",
+                len(parsed_players),
+                len(all_players),
             )
 
-            save_checkpoint(gender, page, all_players)
-
-            if not has_more:
-                logger.info("API indicates no more pages (hasMore=False)")
-                break
-
-            if len(parsed_players) < page_size:
-                logger.info(
-                    f"Received {len(parsed_players)} players (less than page_size={page_size}), "
-                    f"assuming last page"
+            pages_since_checkpoint += 1
+            if pages_since_checkpoint >= checkpoint_every:
+                saved_count = _flush_checkpoint(
+                    gender, completed_page, all_players, saved_count
                 )
-                break
-
-            page += 1
-
-    except Exception as e:
-        logger.error(f"Error on page {page}: {e}")
-        if all_players:
+                checkpoint_page = completed_page
+                pages_since_checkpoint = 0
+
+    except BaseException as e:
+        # Pages are parsed in order, so the one in flight follows the last done
+        logger.error("Error on page %d: %s", completed_page + 1, e)
+        flush_error: Optional[Exception] = None
+        if pages_since_checkpoint:
+            try:
+                saved_count = _flush_checkpoint(
+                    gender, completed_page, all_players, saved_count
+                )
+                checkpoint_page = completed_page
+            except Exception as err:
+                flush_error = err
+        if flush_error is not None:
+            # The earlier checkpoint, if any, is still intact, but the
+            # pages since it were not saved
+            logger.warning(
+                "Could not checkpoint pages %d-%d (%s); "
+                "they will be fetched again on the next run.",
+                checkpoint_page + 1,
+                completed_page,
+                flush_error,
+            )
+        elif checkpoint_page:
             logger.info(
-                f"Progress saved in checkpoint ({len(all_players)} players). "
-                f"Run again to resume from the last successfully saved page."
+                "Progress saved in checkpoint (pages 1-%d). "
+                "Run again to resume from page %d.",
+                checkpoint_page,
+                checkpoint_page + 1,
             )
         else:
             logger.info("No progress to save. Run again to retry from page 1.")
         raise
     finally:
-        session.close()
-        logger.debug("HTTP session closed")
+        if owns_session:
+            session.close()
+            logger.debug("HTTP session closed")
 
     clear_checkpoint(gender)
 
-    logger.info(f"Successfully scraped {len(all_players)} {gender} players")
+    logger.info("Successfully scraped %d %s players", len(all_players), gender)
     return all_players
 
 
@@ -279,16 +797,15 @@ def get_player_bio(player_id: int) -> Optional[PsaPlayerBioRecord]:
     Raises:
     - requests.exceptions.RequestException: on network or HTTP errors
     """
-    logger = get_logger(__name__)
     logger.info(f"Fetching PSA biography for player {player_id}")
 
     url = f"{PSA_PLAYER_URL}/{player_id}"
 
-    session = requests.Session()
+    session = make_session()
     session.headers.update(
         {
             "Accept": "application/json",
-            "User-Agent": next(USER_AGENT_CYCLE),
+            "User-Agent": USER_AGENTS[player_id % len(USER_AGENTS)],
         }
     )
 
@@ -351,7 +868,6 @@ def get_player_bio(player_id: int) -> Optional[PsaPlayerBioRecord]:
 if __name__ == "__main__":
     import pandas as pd
 
-    logger = get_logger(__name__)
     try:
         result = get_rankings("male", page_size=50, resume=True)
         logger.info(f"Total players fetched: {len(result)}")
@@ -5,69 +5,199 @@ Command-line interface for PSA Squash Rankings Scraper.
 import sys
 import argparse
 import logging
-import pandas as pd
-from typing import Literal, cast
-
-from psa_squash_rankings.api_scraper import get_rankings, get_player_bio
-from psa_squash_rankings.html_scraper import scrape_rankings_html
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Literal, Optional, Sequence
+
+import requests
+
+from psa_squash_rankings.api_scraper import (
+    get_rankings,
+    get_player_bio,
+    iter_ranking_pages,
+    make_api_session,
+)
+from psa_squash_rankings.html_scraper import (
+    clear_html_cache,
+    make_html_session,
+    scrape_rankings_html,
+)
 from psa_squash_rankings.squashinfo_scraper import (
     get_recent_tournaments,
     get_tournament_matches,
     get_player_recent_matches,
     get_player_recent_tournaments,
 )
-from psa_squash_rankings.exporter import export_to_csv
-from psa_squash_rankings.logger import get_logger
-from psa_squash_rankings.config import init_dirs, OUTPUT_DIR
+from psa_squash_rankings.exporter import export_to_csv, export_pages_to_csv
+from psa_squash_rankings.logger import (
+    configure_log_level,
+    get_logger,
+    skip_unused_record_fields,
+)
+from psa_squash_rankings.config import init_dirs, HTML_CACHE_DIR, OUTPUT_DIR
+from psa_squash_rankings.schema import HtmlPlayerRecord
 
 logger = get_logger(__name__)
 
+# --gender choice -> genders to scrape, in order
+_GENDER_MAP: dict[str, tuple[Literal["male", "female"], ...]] = {
+    "both": ("male", "female"),
+    "male": ("male",),
+    "female": ("female",),
+}
 
-def _run_rankings(args) -> int:
-    """Scrape PSA player rankings."""
-    gender_arg = cast(Literal["male", "female", "both"], args.gender)
-    genders = ["male", "female"] if gender_arg == "both" else [gender_arg]
 
-    success_count = 0
-    failure_count = 0
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 
-    for gender in genders:
-        logger.info("")
-        logger.info("=" * 60)
-        logger.info(f"Processing {gender.capitalize()} Rankings")
-        logger.info("=" * 60)
+def _write_records_csv(records: Sequence[Any], output_path: Path) -> None:
+    """Write squashinfo/bio records to CSV via pandas, imported only when needed."""
+    import pandas as pd
 
-        try:
-            gender_literal = cast(Literal["male", "female"], gender)
+    pd.DataFrame(records).to_csv(output_path, index=False)
+
+
+def _scrape_gender(
+    gender: Literal["male", "female"],
+    args,
+    api_session: requests.Session,
+    html_fallback: Callable[[], list[HtmlPlayerRecord]],
+    stop: Optional[threading.Event] = None,
+) -> bool:
+    """
+    Scrape and export one gender's rankings, falling back to HTML on failure.
+
+    stop is set by the main thread on Ctrl-C; the scrape then checkpoints and
+    raises KeyboardInterrupt instead of exporting or falling back.
+    """
+    logger.info("")
+    logger.info("=" * 60)
+    logger.info(f"Processing {gender.capitalize()} Rankings")
+    logger.info("=" * 60)
+
+    try:
+        output_file = f"psa_rankings_{gender}.csv"
+
+        if args.stream:
+            # Write each page as it arrives; no checkpoints or resume
+            pages = iter_ranking_pages(
+                gender=gender,
+                page_size=args.page_size,
+                max_pages=args.max_pages,
+                session=api_session,
+                stop=stop,
+            )
+            player_count = export_pages_to_csv(pages, output_file)
+        else:
             result = get_rankings(
-                gender=gender_literal,
+                gender=gender,
                 page_size=args.page_size,
                 max_pages=args.max_pages,
                 resume=not args.no_resume,
+                session=api_session,
+                checkpoint_every=args.checkpoint_every,
+                stop=stop,
             )
-
-            output_file = f"psa_rankings_{gender}.csv"
             export_to_csv(result, output_file)
+            player_count = len(result)
 
-            logger.info(f"Successfully scraped {len(result)} {gender} players")
-            logger.info(f"Data exported to: {output_file}")
-            success_count += 1
+        logger.info(f"Successfully scraped {player_count} {gender} players")
+        logger.info(f"Data exported to: {output_file}")
+        return True
 
-        except Exception as e:
-            logger.error(f"API failed for {gender}: {e}")
-            logger.info(f"Attempting HTML fallback for {gender}...")
+    except Exception as e:
+        logger.error(f"API failed for {gender}: {e}")
+        logger.info(f"Attempting HTML fallback for {gender}...")
+
+        try:
+            fallback_result = html_fallback()
+            fallback_file = f"psa_rankings_{gender}_fallback.csv"
+            export_to_csv(fallback_result, fallback_file)
+            logger.info(f"Fallback successful: {fallback_file}")
+            return True
+
+        except Exception as html_err:
+            logger.error(f"Critical Error: Both sources failed for {gender}")
+            logger.exception(f"Error details: {html_err}")
+            return False
+
+
+def _scrape_in_parallel(
+    genders: Sequence[Literal["male", "female"]],
+    args,
+    api_session: requests.Session,
+    html_fallback: Callable[[], list[HtmlPlayerRecord]],
+) -> list[bool]:
+    """
+    Scrape each gender on its own worker thread (independent, I/O-bound).
+
+    Only the main thread receives Ctrl-C, so on KeyboardInterrupt the workers
+    are signalled to checkpoint and stop at their next page, and scrapes not
+    yet started are cancelled, before the interrupt is re-raised.
+    """
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=len(genders))
+    try:
+        futures = [
+            executor.submit(
+                _scrape_gender, gender, args, api_session, html_fallback, stop
+            )
+            for gender in genders
+        ]
+        return [future.result() for future in as_completed(futures)]
+    except KeyboardInterrupt:
+        stop.set()
+        raise
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _run_rankings(args) -> int:
+    """Scrape PSA player rankings, one worker thread per gender when scraping both."""
+    genders = _GENDER_MAP[args.gender]
+
+    if args.clear_html_cache:
+        clear_html_cache(HTML_CACHE_DIR)
+
+    # One pooled session for every gender, so connections are reused
+    api_session = make_api_session()
+
+    # The HTML session is created on the first fallback and shared by later
+    # ones. Fallbacks run one at a time: they fetch the same page, so the
+    # second one revalidates the cached copy instead of racing to write it.
+    html_lock = threading.Lock()
+    html_sessions: list[requests.Session] = []
+
+    def html_fallback() -> list[HtmlPlayerRecord]:
+        with html_lock:
+            if not html_sessions:
+                html_sessions.append(make_html_session())
+            return scrape_rankings_html(
+                session=html_sessions[0], cache_dir=HTML_CACHE_DIR
+            )
 
-            try:
-                fallback_result = scrape_rankings_html()
-                fallback_file = f"psa_rankings_{gender}_fallback.csv"
-                export_to_csv(fallback_result, fallback_file)
-                logger.info(f"Fallback successful: {fallback_file}")
-                success_count += 1
+    try:
+        if len(genders) == 1:
+            # Inline, so Ctrl-C interrupts the scrape directly
+            outcomes = [_scrape_gender(genders[0], args, api_session, html_fallback)]
+        else:
+            outcomes = _scrape_in_parallel(genders, args, api_session, html_fallback)
+    finally:
+        api_session.close()
+        for html_session in html_sessions:
+            html_session.close()
 
-            except Exception as html_err:
-                logger.error(f"Critical Error: Both sources failed for {gender}")
-                logger.exception(f"Error details: {html_err}")
-                failure_count += 1
+    success_count = outcomes.count(True)
+    failure_count = outcomes.count(False)
 
     logger.info("")
     logger.info("=" * 60)
@@ -91,7 +221,7 @@ def _run_tournaments(args) -> int:
             return 1
 
         output_path = OUTPUT_DIR / "squashinfo_tournaments.csv"
-        pd.DataFrame(tournaments).to_csv(output_path, index=False)
+        _write_records_csv(tournaments, output_path)
 
         logger.info(f"Fetched {len(tournaments)} tournaments")
         logger.info("Data exported to: squashinfo_tournaments.csv")
@@ -115,7 +245,7 @@ def _run_matches(args) -> int:
             return 1
 
         output_path = OUTPUT_DIR / f"squashinfo_matches_{args.event_id}.csv"
-        pd.DataFrame(matches).to_csv(output_path, index=False)
+        _write_records_csv(matches, output_path)
 
         logger.info(f"Fetched {len(matches)} matches")
         logger.info(f"Data exported to: squashinfo_matches_{args.event_id}.csv")
@@ -138,7 +268,7 @@ def _run_player_history(args) -> int:
         matches = get_player_recent_matches(args.player_id, args.slug)
         if matches:
             output_path = OUTPUT_DIR / f"squashinfo_player_{args.player_id}_matches.csv"
-            pd.DataFrame(matches).to_csv(output_path, index=False)
+            _write_records_csv(matches, output_path)
             logger.info(f"Fetched {len(matches)} recent matches")
             logger.info(
                 f"Data exported to: squashinfo_player_{args.player_id}_matches.csv"
@@ -155,7 +285,7 @@ def _run_player_history(args) -> int:
             output_path = (
                 OUTPUT_DIR / f"squashinfo_player_{args.player_id}_tournaments.csv"
             )
-            pd.DataFrame(tournaments).to_csv(output_path, index=False)
+            _write_records_csv(tournaments, output_path)
             logger.info(f"Fetched {len(tournaments)} recent tournaments")
             logger.info(
                 f"Data exported to: squashinfo_player_{args.player_id}_tournaments.csv"
@@ -182,7 +312,7 @@ def _run_player_bio(args) -> int:
             return 1
 
         output_path = OUTPUT_DIR / f"psa_player_{args.player_id}_bio.csv"
-        pd.DataFrame([bio]).to_csv(output_path, index=False)
+        _write_records_csv([bio], output_path)
 
         logger.info(f"Fetched biography for {bio['name']}")
         logger.info(f"Data exported to: psa_player_{args.player_id}_bio.csv")
@@ -242,6 +372,28 @@ def main() -> int:
     rankings_parser.add_argument(
         "--no-resume", action="store_true", help="Start fresh, ignore checkpoints"
     )
+    rankings_parser.add_argument(
+        "--checkpoint-every",
+        type=_positive_int,
+        default=None,
+        metavar="N",
+        help="Save a checkpoint every N pages (default: 5)",
+    )
+    rankings_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Write rankings to CSV page by page (bounded memory). Saves no "
+            "checkpoints and always starts from page 1, so --no-resume is "
+            "implied and --checkpoint-every cannot be combined with it"
+        ),
+    )
+
+    rankings_parser.add_argument(
+        "--clear-html-cache",
+        action="store_true",
+        help="Discard the cached rankings page so an HTML fallback refetches it",
+    )
 
     # tournaments subcommand
     tournaments_parser = subparsers.add_parser(
@@ -308,13 +460,17 @@ def main() -> int:
         args.page_size = 100
         args.max_pages = None
         args.no_resume = False
+        args.checkpoint_every = None
+        args.stream = False
+        args.clear_html_cache = False
+
+    if args.command == "rankings" and args.stream and args.checkpoint_every is not None:
+        parser.error("--checkpoint-every cannot be used with --stream")
 
     init_dirs()
 
-    logging.getLogger().setLevel(getattr(logging, args.log_level))
-    for handler in logging.getLogger().handlers:
-        if isinstance(handler, logging.StreamHandler):
-            handler.setLevel(getattr(logging, args.log_level))
+    skip_unused_record_fields()
+    configure_log_level(getattr(logging, args.log_level))
 
     logger.info("=" * 60)
     logger.info("PSA Squash Scraper - Starting")
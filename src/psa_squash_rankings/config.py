@@ -5,6 +5,10 @@ Centralized configuration for PSA Squash Rankings Scraper.
 from pathlib import Path
 import os
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
@@ -14,7 +18,11 @@ USER_AGENTS = [
 
 API_BASE_URL = "https://psa-api.ptsportsuite.com/rankedplayers"
 PSA_PLAYER_URL = "https://psa-api.ptsportsuite.com/player"
-API_TIMEOUT = 10
+# (connect, read) in seconds: an unreachable host fails fast, a slow page still loads
+API_TIMEOUT = (3.05, 10)
+API_MAX_WORKERS = 8
+# Longest pause honoured from rate-limit headers, in seconds
+RATE_LIMIT_MAX_WAIT = 60
 
 HTML_BASE_URL = "https://www.psasquashtour.com/rankings/"
 HTML_TIMEOUT = 15
@@ -22,6 +30,13 @@ HTML_TIMEOUT = 15
 SQUASHINFO_BASE_URL = "https://www.squashinfo.com"
 SQUASHINFO_TIMEOUT = 15
 
+HTTP_POOL_CONNECTIONS = 16
+# Never smaller than the page-fetch worker count, so workers don't queue on the pool
+HTTP_POOL_MAXSIZE = max(32, API_MAX_WORKERS)
+HTTP_RETRY_TOTAL = 5
+HTTP_RETRY_BACKOFF = 0.3
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
 
 # Use current working directory for output (not package location)
 # This allows users to control where files are written
@@ -33,9 +48,57 @@ def get_data_dir() -> Path:
 CHECKPOINT_DIR = get_data_dir() / "checkpoints"
 LOG_DIR = get_data_dir() / "logs"
 OUTPUT_DIR = get_data_dir() / "output"
+# Last rankings page fetched by the HTML fallback, revalidated on the next run
+HTML_CACHE_DIR = get_data_dir() / "html_cache"
+
+# Pages scraped between checkpoint writes; progress is also flushed on error.
+CHECKPOINT_EVERY_N_PAGES = 5
 
 
 def init_dirs() -> None:
     """Create required directories."""
     for directory in [OUTPUT_DIR, LOG_DIR, CHECKPOINT_DIR]:
         directory.mkdir(exist_ok=True)
+
+
+class _CappedRetry(Retry):
+    """Retry whose Retry-After sleeps are capped at RATE_LIMIT_MAX_WAIT seconds."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RATE_LIMIT_MAX_WAIT)
+
+
+def make_session() -> requests.Session:
+    """
+    Create an HTTP session with connection pooling and retries on transient errors.
+
+    Connections (and their TLS handshakes) are reused across every request made
+    through the session. Requests failing with a status in HTTP_RETRY_STATUSES
+    are retried with exponential backoff, waiting at least as long as any
+    Retry-After header asks, up to RATE_LIMIT_MAX_WAIT seconds; once retries
+    are exhausted the final response is returned so callers still see it via
+    raise_for_status().
+
+    Returns:
+    - Configured requests.Session (caller is responsible for closing it)
+    """
+    session = requests.Session()
+    retry = _CappedRetry(
+        total=HTTP_RETRY_TOTAL,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
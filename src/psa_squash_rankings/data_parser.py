@@ -5,12 +5,24 @@ Includes schema validation to detect API changes early
 and prevent silent data corruption.
 """
 
+import logging
 import re
+from operator import itemgetter
 from psa_squash_rankings.logger import get_logger
 from typing import Any, Optional
 from psa_squash_rankings.validator import validate_api_schema
 from psa_squash_rankings.schema import ApiPlayerRecord
 
+logger = get_logger(__name__)
+
+_NON_DIGITS_RE = re.compile(r"[^0-9]")
+_DIGIT_RUNS_RE = re.compile(r"\d+")
+
+# Integer API fields, fetched in one call. The API normally sends these as
+# ints already, so int() is only called for string-typed values.
+_INT_FIELDS = ("Id", "Tournaments", "Total Points")
+_get_int_fields = itemgetter(*_INT_FIELDS)
+
 
 def parse_measure(value: Any, unit_label: str) -> Optional[int]:
     """
@@ -23,33 +35,35 @@ def parse_measure(value: Any, unit_label: str) -> Optional[int]:
 
     val_str = str(value).strip().lower()
 
+    # Fast path for the common API formats ("185cm", "75 kg").
+    if val_str.endswith(("cm", "kg")):
+        number = val_str[:-2].rstrip()
+        if number.isascii() and number.isdigit():
+            return int(number)
+
     if "'" in val_str or "ft" in val_str:
-        try:
-            parts = re.findall(r"(\d+)", val_str)
-            if len(parts) >= 2:
-                feet, inches = int(parts[0]), int(parts[1])
-                return round((feet * 12 + inches) * 2.54)
-            elif len(parts) == 1:
-                return round(int(parts[0]) * 30.48)
-        except (ValueError, IndexError):
-            raise ValueError(f"Malformed Imperial height in {unit_label}: '{val_str}'")
+        parts = _DIGIT_RUNS_RE.findall(val_str)
+        if len(parts) >= 2:
+            return round((int(parts[0]) * 12 + int(parts[1])) * 2.54)
+        elif len(parts) == 1:
+            return round(int(parts[0]) * 30.48)
 
+    # Pick the conversion once; every remaining format is a single number
     if "in" in val_str:
-        clean_inches = re.sub(r"[^0-9]", "", val_str)
-        if clean_inches:
-            return round(int(clean_inches) * 2.54)
+        factor = 2.54
+    elif "lb" in val_str or "pound" in val_str:
+        factor = 0.453592
+    else:
+        factor = None
 
-    if "lb" in val_str or "pound" in val_str:
-        clean_lbs = re.sub(r"[^0-9]", "", val_str)
-        if clean_lbs:
-            return round(int(clean_lbs) * 0.453592)
-
-    clean_value = re.sub(r"[^0-9]", "", val_str)
+    clean_value = _NON_DIGITS_RE.sub("", val_str)
 
     if not clean_value:
         raise ValueError(f"No numeric data found for {unit_label}: '{val_str}'")
 
-    return int(clean_value)
+    if factor is None:
+        return int(clean_value)
+    return round(int(clean_value) * factor)
 
 
 def parse_api_player(player: dict[str, Any]) -> ApiPlayerRecord:
@@ -62,44 +76,42 @@ def parse_api_player(player: dict[str, Any]) -> ApiPlayerRecord:
     Raises:
         ValueError: If API schema validation fails
     """
-    logger = get_logger(__name__)
-
     validate_api_schema(player)
 
+    player_id, tournaments, points = _get_int_fields(player)
+
     parsed: ApiPlayerRecord = {
         "rank": player["World Ranking"],
         "player": player["Name"],
-        "id": int(player["Id"]),
-        "tournaments": int(player["Tournaments"]),
-        "points": int(player["Total Points"]),
+        "id": player_id if type(player_id) is int else int(player_id),
+        "tournaments": tournaments if type(tournaments) is int else int(tournaments),
+        "points": points if type(points) is int else int(points),
         "height_cm": None,
         "weight_kg": None,
-        "birthdate": None,
-        "country": None,
+        "birthdate": player.get("Birthdate"),
+        "country": player.get("Country"),
         "picture_url": player.get("Picture") or None,
         "mugshot_url": player.get("Mugshot") or None,
         "source": "api",
     }
 
-    if "Birthdate" in player:
-        parsed["birthdate"] = player["Birthdate"]
-
-    if player.get("Height"):
+    # Optional fields are each looked up once
+    height = player.get("Height")
+    if height:
         try:
-            parsed["height_cm"] = parse_measure(player["Height"], "Height")
+            parsed["height_cm"] = parse_measure(height, "Height")
         except ValueError as e:
-            logger.warning(f"Skipping height for {player.get('Name')}: {e}")
+            logger.warning("Skipping height for %s: %s", player.get("Name"), e)
             parsed["height_cm"] = None
 
-    if player.get("Weight"):
+    weight = player.get("Weight")
+    if weight:
         try:
-            parsed["weight_kg"] = parse_measure(player["Weight"], "Weight")
+            parsed["weight_kg"] = parse_measure(weight, "Weight")
         except ValueError as e:
-            logger.warning(f"Skipping weight for {player.get('Name')}: {e}")
+            logger.warning("Skipping weight for %s: %s", player.get("Name"), e)
             parsed["weight_kg"] = None
 
-    if "Country" in player:
-        parsed["country"] = player["Country"]
-
-    logger.debug(f"Parsed player: {parsed['player']} (Rank: {parsed['rank']})")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Parsed player: %s (Rank: %s)", parsed["player"], parsed["rank"])
     return parsed
@@ -5,12 +5,121 @@ Handles exporting parsed ranking data to disk.
 Supports both API and HTML scraper outputs with appropriate column handling.
 """
 
-import pandas as pd
+import contextlib
+import csv
+import itertools
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Sequence
 
 from psa_squash_rankings.logger import get_logger
 from psa_squash_rankings.schema import ScraperResult, is_api_result, is_html_result
 from psa_squash_rankings.config import OUTPUT_DIR
 
+if TYPE_CHECKING:
+    # pandas is only needed for the DataFrame helpers; CSV export is stdlib
+    import pandas as pd
+
+# Integer columns shared by API and HTML records. Nullable Int64 keeps
+# missing height/weight values from promoting the whole column to float.
+_INT_COLUMNS = ("rank", "id", "tournaments", "points", "height_cm", "weight_kg")
+
+# Rows are short, so a large buffer turns thousands of small writes into a few
+_CSV_BUFFER_SIZE = 1 << 20
+
+
+def records_to_frame(data: ScraperResult) -> "pd.DataFrame":
+    """
+    Build a DataFrame column-by-column from scraper records.
+
+    Public helper for library users who want rankings in pandas; the CSV
+    exporters in this module write through csv.writer and do not use it.
+    Avoids pandas' row-wise list-of-dicts construction and per-column dtype
+    inference. Column order follows the keys of the first record.
+
+    Parameters:
+    - data: non-empty ScraperResult (list of ApiPlayerRecord or HtmlPlayerRecord)
+
+    Returns:
+    - DataFrame with nullable Int64 integer columns
+    """
+    import pandas as pd
+
+    fields = list(data[0].keys())
+    columns = {field: [record.get(field) for record in data] for field in fields}
+    dtypes = {field: "Int64" for field in _INT_COLUMNS if field in columns}
+    return pd.DataFrame(columns, columns=fields).astype(dtypes)
+
+
+def concat_pages(frames: Iterable["pd.DataFrame"]) -> "pd.DataFrame":
+    """
+    Combine per-page DataFrames into one with a single concatenation.
+
+    Public helper for library users, paired with records_to_frame; the CSV
+    exporters do not use it. Concatenating inside a page loop copies every
+    earlier row again on each page (quadratic in the number of rows);
+    collect the frames and call this once instead.
+
+    Parameters:
+    - frames: per-page DataFrames, e.g. records_to_frame() of each page
+      yielded by api_scraper.iter_ranking_pages
+
+    Returns:
+    - DataFrame with a fresh RangeIndex (empty if no frames were given)
+    """
+    import pandas as pd
+
+    frames = list(frames)
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def _write_csv_pages(
+    path: Path,
+    first_page: Sequence[Mapping[str, Any]],
+    pages: Iterable[Sequence[Mapping[str, Any]]],
+) -> tuple[int, list[str]]:
+    """
+    Write record pages to a CSV file as they are produced.
+
+    The header comes from the keys of the first record. Later records are
+    written in header order: a missing key or a None value becomes an empty
+    field, matching pandas' to_csv output, and keys not in the header are
+    dropped.
+
+    Rows go to a temporary sibling that replaces path only once every page
+    has been written, so a scrape failing mid-stream leaves any previous
+    export intact instead of a truncated file.
+
+    Returns:
+    - (rows written, column names)
+    """
+    fieldnames = list(first_page[0].keys())
+    rows = 0
+
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    try:
+        with open(
+            tmp_path, "w", newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE
+        ) as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(fieldnames)
+            for page in itertools.chain([first_page], pages):
+                # Plain lists skip DictWriter's per-row key check and generator
+                writer.writerows(
+                    [record.get(field) for field in fieldnames] for record in page
+                )
+                rows += len(page)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
+    return rows, fieldnames
+
 
 def export_to_csv(data: ScraperResult, filename: str) -> None:
     """
@@ -51,13 +160,56 @@ def export_to_csv(data: ScraperResult, filename: str) -> None:
             logger.error("Unknown data source type in export")
 
         OUTPUT = OUTPUT_DIR / filename
-        df = pd.DataFrame(data)
-        df.to_csv(OUTPUT, index=False)
+        rows, columns = _write_csv_pages(OUTPUT, data, [])
 
-        logger.info(f"Successfully exported {len(df)} rows to {filename}")
+        logger.info(f"Successfully exported {rows} rows to {filename}")
 
-        logger.debug(f"CSV columns: {', '.join(df.columns)}")
+        logger.debug("CSV columns: %s", ", ".join(columns))
 
     except Exception as e:
         logger.error(f"Failed to export data to {filename}: {e}")
         raise
+
+
+def export_pages_to_csv(pages: Iterable[ScraperResult], filename: str) -> int:
+    """
+    Stream pages of scraper results to a CSV file.
+
+    Each page is written as soon as it is produced, so memory stays bounded
+    by one page regardless of the total number of records. Pair with
+    api_scraper.iter_ranking_pages to scrape straight to disk.
+
+    Parameters:
+    - pages: iterable of ScraperResult pages (all from the same source)
+    - filename: output CSV file name
+
+    Returns:
+    - Number of rows written (0 if there was no data; no file is created)
+    """
+    logger = get_logger(__name__)
+
+    pages = iter(pages)
+    first_page = next((page for page in pages if page), None)
+
+    if first_page is None:
+        logger.warning("No data to export to %s", filename)
+        return 0
+
+    if is_html_result(first_page):
+        logger.warning(
+            "Streaming DEGRADED HTML records to %s - "
+            "missing player IDs and biographical data",
+            filename,
+        )
+    else:
+        logger.info("Streaming records to %s", filename)
+
+    try:
+        rows, columns = _write_csv_pages(OUTPUT_DIR / filename, first_page, pages)
+    except Exception as e:
+        logger.error("Failed to export data to %s: %s", filename, e)
+        raise
+
+    logger.info("Successfully exported %d rows to %s", rows, filename)
+    logger.debug("CSV columns: %s", ", ".join(columns))
+    return rows
@@ -10,28 +10,139 @@ Returns HtmlPlayerRecord objects which lack:
 """
 
 import os
-import itertools
+import json
+import random
+import contextlib
 import requests
-from bs4 import BeautifulSoup
+from pathlib import Path
+from typing import Optional
+import lxml.html
+from lxml import etree  # type: ignore  # compiled module without type stubs
 from psa_squash_rankings.logger import get_logger
 from psa_squash_rankings.schema import HtmlPlayerRecord
 from psa_squash_rankings.config import (
     HTML_BASE_URL,
+    HTML_CACHE_DIR,
     HTML_TIMEOUT,
     USER_AGENTS,
+    make_session,
 )
 
+logger = get_logger(__name__)
+
+# Cached copy of the rankings page and its validators, kept under cache_dir.
+# Only the latest page is kept: each full response overwrites it.
+_CACHE_PAGE = "rankings_page.html"
+_CACHE_META = "rankings_page.json"
+
+# Compiled once; each evaluation runs in libxml2 rather than walking the tree in Python
+_FIRST_TABLE = etree.XPath("(//table)[1]")
+_FIRST_TBODY = etree.XPath("(.//tbody)[1]")
+_BODY_ROWS = etree.XPath(".//tr")
+_DIRECT_ROWS = etree.XPath("./tr")
+_ROW_CELLS = etree.XPath("./td[position() <= 4]")
+_MUGSHOT_SRC = etree.XPath(
+    ".//img[contains(concat(' ', normalize-space(@class), ' '), ' mugshot ')]/@src"
+)
+
+
+def make_html_session() -> requests.Session:
+    """
+    Create a pooled session for the rankings HTML page, honouring HTTP(S)_PROXY.
+
+    Pass the session to scrape_rankings_html to reuse its connection across
+    several fallback scrapes (e.g. both genders). The caller is responsible
+    for closing it.
+    """
+    proxy_url = os.getenv("HTTP_PROXY") or os.getenv("HTTPS_PROXY")
+    proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
+
+    if proxies:
+        logger.debug("Using proxy: %s", proxy_url)
+
+    session = make_session()
 
-USER_AGENT_CYCLE = itertools.cycle(USER_AGENTS)
+    session.headers.update({"User-Agent": random.choice(USER_AGENTS)})
+    logger.debug("User-Agent: %s", session.headers["User-Agent"])
 
+    if proxies:
+        session.proxies.update(proxies)
+
+    return session
 
-def scrape_rankings_html() -> list[HtmlPlayerRecord]:
+
+def _load_cached_page(cache_dir: Path) -> tuple[Optional[str], dict[str, str]]:
+    """
+    Read the cached rankings page and the conditional-request headers for it.
+
+    Returns:
+    - (cached HTML or None, If-Modified-Since/If-None-Match headers)
+    """
+    try:
+        html_text = (cache_dir / _CACHE_PAGE).read_text(encoding="utf-8")
+        validators = json.loads((cache_dir / _CACHE_META).read_text())
+    except (OSError, ValueError):
+        return None, {}
+
+    headers = {}
+    if isinstance(validators.get("last_modified"), str):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    if isinstance(validators.get("etag"), str):
+        headers["If-None-Match"] = validators["etag"]
+    return html_text, headers
+
+
+def _save_cached_page(cache_dir: Path, response: requests.Response) -> None:
+    """Cache a rankings page that carries Last-Modified and/or ETag validators."""
+    validators = {
+        key: value
+        for key, value in (
+            ("last_modified", response.headers.get("Last-Modified")),
+            ("etag", response.headers.get("ETag")),
+        )
+        if isinstance(value, str)
+    }
+    if not validators:
+        return
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / _CACHE_PAGE).write_text(response.text, encoding="utf-8")
+        (cache_dir / _CACHE_META).write_text(json.dumps(validators))
+    except OSError as e:
+        logger.warning(f"Could not cache rankings HTML: {e}")
+
+
+def clear_html_cache(cache_dir: Path = HTML_CACHE_DIR) -> None:
+    """
+    Remove the cached rankings page, so the next fallback fetches it in full.
+
+    Parameters:
+    - cache_dir: cache directory passed to scrape_rankings_html
+    """
+    for name in (_CACHE_PAGE, _CACHE_META):
+        with contextlib.suppress(FileNotFoundError):
+            (cache_dir / name).unlink()
+    logger.info("HTML cache cleared: %s", cache_dir)
+
+
+def scrape_rankings_html(
+    session: Optional[requests.Session] = None,
+    cache_dir: Optional[Path] = None,
+) -> list[HtmlPlayerRecord]:
     """
     Fallback scraper that parses the PSA rankings HTML table.
 
     WARNING: Returns degraded data without player IDs or biographical info.
     This should only be used when the API is unavailable.
 
+    Parameters:
+    - session: session from make_html_session to reuse; left open when given
+    - cache_dir: directory to cache the page in (e.g. HTML_CACHE_DIR); when
+      set, the request is made conditional and a 304 Not Modified reuses the
+      cached page. Only the latest page is kept, until a newer one replaces
+      it or clear_html_cache removes it
+
     Returns:
     - list[HtmlPlayerRecord]: Limited player records (rank, name, tournaments, points only)
 
@@ -41,32 +152,30 @@ def scrape_rankings_html() -> list[HtmlPlayerRecord]:
 
     Note: May return limited results if content is JS-rendered.
     """
-    logger = get_logger(__name__)
-
     logger.warning(
         "Using HTML fallback scraper - data will be incomplete "
         "(no player IDs or biographical information)"
     )
     logger.info("Fetching rankings from HTML (fallback)...")
-    logger.debug(f"Request URL: {HTML_BASE_URL}")
+    logger.debug("Request URL: %s", HTML_BASE_URL)
 
-    proxy_url = os.getenv("HTTP_PROXY") or os.getenv("HTTPS_PROXY")
-    proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-
-    if proxies:
-        logger.debug(f"Using proxy: {proxy_url}")
-
-    session = requests.Session()
-
-    session.headers.update({"User-Agent": next(USER_AGENT_CYCLE)})
-    logger.debug(f"User-Agent: {session.headers['User-Agent']}")
+    owns_session = session is None
+    if session is None:
+        session = make_html_session()
 
-    if proxies:
-        session.proxies.update(proxies)
+    cached_html: Optional[str] = None
+    conditional_headers: dict[str, str] = {}
+    if cache_dir is not None:
+        cached_html, conditional_headers = _load_cached_page(cache_dir)
 
     try:
         try:
-            response = session.get(HTML_BASE_URL, timeout=HTML_TIMEOUT)
+            if conditional_headers:
+                response = session.get(
+                    HTML_BASE_URL, headers=conditional_headers, timeout=HTML_TIMEOUT
+                )
+            else:
+                response = session.get(HTML_BASE_URL, timeout=HTML_TIMEOUT)
             response.raise_for_status()
         except requests.exceptions.Timeout:
             logger.error("HTML request timeout")
@@ -78,20 +187,32 @@ def scrape_rankings_html() -> list[HtmlPlayerRecord]:
             logger.error(f"HTML request error: {e}")
             raise
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        table = soup.find("table")
+        if response.status_code == 304 and cached_html is not None:
+            logger.info("Rankings page not modified; using cached HTML")
+            html_text = cached_html
+        else:
+            html_text = response.text
+            if cache_dir is not None:
+                _save_cached_page(cache_dir, response)
+
+        try:
+            root = lxml.html.fromstring(html_text)
+        except etree.ParserError:
+            root = None
+        tables = _FIRST_TABLE(root) if root is not None else []
 
-        if table is None:
+        if not tables:
             logger.error("Could not find rankings table in HTML")
             raise ValueError("Could not find rankings table in HTML.")
 
-        tbody = table.find("tbody")
+        table = tables[0]
+        tbody = _FIRST_TBODY(table)
 
         if tbody:
-            rows = tbody.find_all("tr")
+            rows = _BODY_ROWS(tbody[0])
         else:
             logger.info("No <tbody> found; searching for <tr> directly in <table>.")
-            rows = table.find_all("tr", recursive=False)
+            rows = _DIRECT_ROWS(table)
 
         if not rows:
             logger.error("Rankings table found, but no rows (<tr>) were detected.")
@@ -100,22 +221,22 @@ def scrape_rankings_html() -> list[HtmlPlayerRecord]:
         data: list[HtmlPlayerRecord] = []
 
         for row in rows:
-            cells = row.find_all("td")
+            cells = [cell.text_content().strip() for cell in _ROW_CELLS(row)]
             if len(cells) < 4:
                 logger.warning(f"Skipping row with insufficient cells: {len(cells)}")
                 continue
 
             try:
-                rank = int(cells[0].get_text(strip=True))
-                player = cells[1].get_text(strip=True)
-                tournaments = int(cells[2].get_text(strip=True))
-                points = int(cells[3].get_text(strip=True).replace(",", ""))
+                rank = int(cells[0])
+                player = cells[1]
+                tournaments = int(cells[2])
+                points = int(cells[3].replace(",", ""))
             except ValueError as e:
                 logger.warning(f"Skipping row with invalid data: {e}")
                 continue
 
-            mugshot_img = row.find("img", class_="mugshot")
-            mugshot_url = mugshot_img.get("src") if mugshot_img else None
+            mugshot_src = _MUGSHOT_SRC(row)
+            mugshot_url = str(mugshot_src[0]) if mugshot_src else None
 
             record: HtmlPlayerRecord = {
                 "rank": rank,
@@ -137,12 +258,12 @@ def scrape_rankings_html() -> list[HtmlPlayerRecord]:
         return data
 
     finally:
-        session.close()
-        logger.debug("HTTP session closed")
+        if owns_session:
+            session.close()
+            logger.debug("HTTP session closed")
 
 
 if __name__ == "__main__":
-    logger = get_logger(__name__)
     try:
         result = scrape_rankings_html()
         logger.info(f"Successfully scraped {len(result)} players from HTML.")
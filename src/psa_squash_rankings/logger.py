@@ -9,49 +9,90 @@ import logging
 import os
 import sys
 from datetime import datetime
+from typing import Optional, Union
 
 from psa_squash_rankings.config import LOG_DIR
 
+# Loggers already configured by setup_logger, keyed by name
+_LOGGERS: dict[str, logging.Logger] = {}
 
-def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
-    """
-    Set up a logger with consistent formatting and handlers.
+# One log file per process, shared by every logger
+_LOG_FILE = LOG_DIR / f"psa_scraper_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
 
-    Parameters:
-    - name: Logger name (usually __name__ from calling module)
-    - level: Logging level (default: INFO)
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
 
-    Returns:
-    - Configured logger instance
+_HANDLERS: list[logging.Handler] = []
+
+# Level applied to loggers created by setup_logger; see configure_log_level
+_LEVEL = logging.INFO
+
+
+class _LazyFileHandler(logging.FileHandler):
     """
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
+    File handler that creates its directory and file on the first record.
 
-    if logger.handlers:
-        return logger
+    Loggers are set up when modules are imported, so opening the file
+    eagerly would leave an empty log behind for every import.
+    """
+
+    def __init__(self, filename: Union[str, "os.PathLike[str]"]) -> None:
+        super().__init__(filename, mode="a", encoding="utf-8", delay=True)
 
-    log_file = LOG_DIR / f"psa_scraper_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
 
-    log_dir = os.path.dirname(log_file)
-    if log_dir:
-        os.makedirs(log_dir, exist_ok=True)
 
-    formatter = logging.Formatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+def _get_handlers() -> list[logging.Handler]:
+    """Create the shared console and file handlers on first use."""
+    if _HANDLERS:
+        return _HANDLERS
 
+    # The console follows the logger level, so configure_log_level controls
+    # it without touching handlers; the file handler keeps DEBUG as its floor.
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
 
-    file_handler = logging.FileHandler(log_file, mode="a", encoding="utf-8")
+    file_handler = _LazyFileHandler(_LOG_FILE)
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
+    file_handler.setFormatter(_FORMATTER)
+
+    _HANDLERS.extend([console_handler, file_handler])
+    return _HANDLERS
+
+
+def setup_logger(name: str, level: Optional[int] = None) -> logging.Logger:
+    """
+    Set up a logger with consistent formatting and handlers.
+
+    Each name is configured once; later calls return the cached logger
+    unchanged, so a level adjusted after setup is not reset. All loggers
+    write through the same console and file handlers, so a run produces a
+    single log file.
+
+    Parameters:
+    - name: Logger name (usually __name__ from calling module)
+    - level: Logging level (default: the level set by configure_log_level,
+      INFO unless changed)
+
+    Returns:
+    - Configured logger instance
+    """
+    cached = _LOGGERS.get(name)
+    if cached is not None:
+        return cached
+
+    logger = logging.getLogger(name)
+    logger.setLevel(_LEVEL if level is None else level)
 
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    if not logger.handlers:
+        for handler in _get_handlers():
+            logger.addHandler(handler)
 
+    _LOGGERS[name] = logger
     return logger
 
 
@@ -66,3 +107,30 @@ def get_logger(name: str) -> logging.Logger:
     - Logger instance
     """
     return setup_logger(name)
+
+
+def configure_log_level(level: int) -> None:
+    """
+    Set the level of every package logger, including ones created later.
+
+    Parameters:
+    - level: Logging level (e.g. logging.DEBUG)
+    """
+    global _LEVEL
+    _LEVEL = level
+    for logger in _LOGGERS.values():
+        logger.setLevel(level)
+
+
+def skip_unused_record_fields() -> None:
+    """
+    Stop the logging module collecting record fields _FORMATTER never shows.
+
+    Skips the caller lookup (file, line, function) and the thread and
+    process fields for every record in the process, so it is meant for
+    the CLI entry point rather than library import time.
+    """
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
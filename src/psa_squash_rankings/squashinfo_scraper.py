@@ -6,7 +6,7 @@ event pages. Returns TournamentRecord and MatchRecord objects.
 """
 
 import re
-import itertools
+import random
 import requests
 from typing import Optional
 from bs4 import BeautifulSoup
@@ -22,13 +22,14 @@ from psa_squash_rankings.config import (
     SQUASHINFO_BASE_URL,
     SQUASHINFO_TIMEOUT,
     USER_AGENTS,
+    make_session,
 )
 
-USER_AGENT_CYCLE = itertools.cycle(USER_AGENTS)
+logger = get_logger(__name__)
 
 
 def _make_session() -> requests.Session:
-    session = requests.Session()
+    session = make_session()
     session.headers.update(
         {
             "Accept": "text/html,application/xhtml+xml",
@@ -197,7 +198,6 @@ def get_recent_tournaments(max_pages: Optional[int] = 1) -> list[TournamentRecor
     Raises:
     - requests.exceptions.RequestException: on network errors
     """
-    logger = get_logger(__name__)
     logger.info(
         f"Fetching recent tournaments from squashinfo.com (max_pages={max_pages})"
     )
@@ -216,7 +216,7 @@ def get_recent_tournaments(max_pages: Optional[int] = 1) -> list[TournamentRecor
                 if page == 1
                 else f"{SQUASHINFO_BASE_URL}/results?start={page}"
             )
-            session.headers["User-Agent"] = next(USER_AGENT_CYCLE)
+            session.headers["User-Agent"] = random.choice(USER_AGENTS)
 
             logger.info(f"Fetching tournaments page {page}...")
             try:
@@ -272,12 +272,11 @@ def get_tournament_matches(event_id: int, slug: str) -> list[MatchRecord]:
     Raises:
     - requests.exceptions.RequestException: on network errors
     """
-    logger = get_logger(__name__)
     logger.info(f"Fetching matches for event {event_id} ({slug})")
 
     url = f"{SQUASHINFO_BASE_URL}/events/{event_id}-{slug}"
     session = _make_session()
-    session.headers["User-Agent"] = next(USER_AGENT_CYCLE)
+    session.headers["User-Agent"] = random.choice(USER_AGENTS)
 
     try:
         response = session.get(url, timeout=SQUASHINFO_TIMEOUT)
@@ -460,12 +459,11 @@ def get_player_recent_matches(
     Raises:
     - requests.exceptions.RequestException: on network errors
     """
-    logger = get_logger(__name__)
     logger.info(f"Fetching recent matches for player {player_id} ({slug})")
 
     url = f"{SQUASHINFO_BASE_URL}/player/{player_id}-{slug}"
     session = _make_session()
-    session.headers["User-Agent"] = next(USER_AGENT_CYCLE)
+    session.headers["User-Agent"] = random.choice(USER_AGENTS)
 
     try:
         response = session.get(url, timeout=SQUASHINFO_TIMEOUT)
@@ -512,12 +510,11 @@ def get_player_recent_tournaments(
     Raises:
     - requests.exceptions.RequestException: on network errors
     """
-    logger = get_logger(__name__)
     logger.info(f"Fetching recent tournaments for player {player_id} ({slug})")
 
     url = f"{SQUASHINFO_BASE_URL}/player/{player_id}-{slug}"
     session = _make_session()
-    session.headers["User-Agent"] = next(USER_AGENT_CYCLE)
+    session.headers["User-Agent"] = random.choice(USER_AGENTS)
 
     try:
         response = session.get(url, timeout=SQUASHINFO_TIMEOUT)
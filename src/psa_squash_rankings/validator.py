@@ -5,20 +5,24 @@ Validates schema consistency and compares API vs HTML scraper outputs
 with explicit handling of their different data structures.
 """
 
-import pandas as pd
-from pandas.errors import EmptyDataError
+import logging
+
 from psa_squash_rankings.logger import get_logger
 from psa_squash_rankings.config import OUTPUT_DIR
 from typing import Literal, Any
 
+# Shared by the per-record validators, which run once per scraped row
+logger = get_logger(__name__)
 
-REQUIRED_API_FIELDS = {
-    "World Ranking",
-    "Name",
-    "Id",
-    "Tournaments",
-    "Total Points",
-}
+REQUIRED_API_FIELDS = frozenset(
+    {
+        "World Ranking",
+        "Name",
+        "Id",
+        "Tournaments",
+        "Total Points",
+    }
+)
 
 
 def validate_api_schema(player: dict[str, Any]) -> None:
@@ -29,19 +33,18 @@ def validate_api_schema(player: dict[str, Any]) -> None:
     Raises:
         ValueError: if the API schema is missing fields
     """
-    logger = get_logger(__name__)
-
-    missing_fields = REQUIRED_API_FIELDS - player.keys()
-
-    if missing_fields:
+    # dict_keys >= frozenset probes each required field without copying keys
+    if not player.keys() >= REQUIRED_API_FIELDS:
+        missing_fields = set(REQUIRED_API_FIELDS - player.keys())
         logger.error(f"API schema validation failed. Missing fields: {missing_fields}")
         raise ValueError(
             f"API schema validation failed. Missing fields: {missing_fields}"
         )
 
-    logger.debug(
-        f"Schema validation passed for player: {player.get('Name', 'Unknown')}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Schema validation passed for player: {player.get('Name', 'Unknown')}"
+        )
 
 
 def validate_scraped_data(gender: Literal["male", "female"] = "male") -> None:
@@ -54,6 +57,9 @@ def validate_scraped_data(gender: Literal["male", "female"] = "male") -> None:
     Parameters:
     - gender: 'male' or 'female'
     """
+    import pandas as pd
+    from pandas.errors import EmptyDataError
+
     logger = get_logger(__name__)
 
     logger.info(f"Starting validation for {gender} rankings")
@@ -218,6 +224,8 @@ def validate_tournaments() -> None:
     Checks that required columns are present, key fields are non-null,
     and prints a summary of tiers and gender breakdown.
     """
+    import pandas as pd
+
     logger = get_logger(__name__)
 
     path = OUTPUT_DIR / "squashinfo_tournaments.csv"
@@ -275,6 +283,8 @@ def validate_matches(event_id: int) -> None:
     Parameters:
     - event_id: numeric tournament event ID
     """
+    import pandas as pd
+
     logger = get_logger(__name__)
 
     path = OUTPUT_DIR / f"squashinfo_matches_{event_id}.csv"
@@ -358,8 +368,6 @@ def validate_player_match_record(match: dict[str, Any]) -> None:
     Raises:
         ValueError: if required fields are missing or values are invalid.
     """
-    logger = get_logger(__name__)
-
     missing = REQUIRED_PLAYER_MATCH_FIELDS - match.keys()
     if missing:
         raise ValueError(f"PlayerRecentMatchRecord missing fields: {missing}")
@@ -392,8 +400,6 @@ def validate_player_tournament_record(tournament: dict[str, Any]) -> None:
     Raises:
         ValueError: if required fields are missing or values are invalid.
     """
-    logger = get_logger(__name__)
-
     missing = REQUIRED_PLAYER_TOURNAMENT_FIELDS - tournament.keys()
     if missing:
         raise ValueError(f"PlayerRecentTournamentRecord missing fields: {missing}")
@@ -424,6 +430,8 @@ def validate_player_data(player_id: int) -> None:
     Parameters:
     - player_id: numeric player ID (e.g. 5974)
     """
+    import pandas as pd
+
     logger = get_logger(__name__)
     logger.info(f"Starting validation for player {player_id}")
 
@@ -556,8 +564,6 @@ def validate_psa_player_bio_record(record: dict[str, Any]) -> None:
     Raises:
         ValueError: if required fields are missing or values are invalid.
     """
-    logger = get_logger(__name__)
-
     missing = REQUIRED_PSA_PLAYER_BIO_FIELDS - record.keys()
     if missing:
         raise ValueError(f"PsaPlayerBioRecord missing fields: {missing}")
@@ -590,6 +596,8 @@ def validate_psa_player_bio(player_id: int) -> None:
     Parameters:
     - player_id: numeric player ID (e.g. 11942)
     """
+    import pandas as pd
+
     logger = get_logger(__name__)
     logger.info(f"Starting PSA biography validation for player {player_id}")
 
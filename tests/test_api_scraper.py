@@ -2,10 +2,22 @@
 Test suite for API scraper functionality in PSA Squash scraper.
 """
 
+import json
 import pytest
 import requests
+import subprocess
+import sys
+import threading
+from requests.adapters import HTTPAdapter
+from typing import Any
 from unittest.mock import Mock, patch, MagicMock
-from psa_squash_rankings.api_scraper import get_rankings, get_player_bio
+from psa_squash_rankings.api_scraper import (
+    get_rankings,
+    get_player_bio,
+    iter_ranking_pages,
+)
+from psa_squash_rankings.config import RATE_LIMIT_MAX_WAIT, make_session
+from psa_squash_rankings.data_parser import parse_api_player
 
 
 @patch("psa_squash_rankings.api_scraper.requests.Session")
@@ -413,6 +425,253 @@ def test_get_rankings_pagination_url_format(mock_session_class: MagicMock) -> No
     mock_session.close.assert_called_once()
 
 
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_uses_separate_connect_timeout(
+    mock_session_class: MagicMock,
+) -> None:
+    """Test that page requests pass a short connect timeout and a longer read one."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.get.return_value.json.return_value = {"players": [], "hasMore": False}
+
+    get_rankings("male", resume=False)
+
+    connect_timeout, read_timeout = mock_session.get.call_args.kwargs["timeout"]
+    assert connect_timeout < read_timeout
+
+
+def _paged_response_by_url(total: int, page_size: int, report_pages: bool = False):
+    """
+    Build a session.get side_effect that serves pages based on the request URL.
+
+    Responses report 'total' players, or 'totalPages' when report_pages is set.
+    """
+
+    def _get(url: str, **kwargs) -> Mock:
+        page = int(url.split("page=")[1].split("&")[0])
+        first = (page - 1) * page_size + 1
+        last = min(page * page_size, total)
+        response = Mock()
+        response.raise_for_status = Mock()
+        body: dict[str, Any] = {
+            "players": [
+                {
+                    "World Ranking": i,
+                    "Name": f"Player {i}",
+                    "Id": 1000 + i,
+                    "Tournaments": 10,
+                    "Total Points": 10000 - i,
+                }
+                for i in range(first, last + 1)
+            ],
+            "hasMore": last < total,
+        }
+        if report_pages:
+            body["totalPages"] = -(-total // page_size)
+        else:
+            body["total"] = total
+        response.json.return_value = body
+        return response
+
+    return _get
+
+
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_fetches_remaining_pages_when_total_known(
+    mock_session_class: MagicMock,
+) -> None:
+    """Test that a reported total fetches exactly the remaining pages, in rank order."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.get.side_effect = _paged_response_by_url(total=45, page_size=10)
+
+    result = get_rankings("male", page_size=10, resume=False)
+
+    assert mock_session.get.call_count == 5
+    assert [record["rank"] for record in result] == list(range(1, 46))
+    mock_session.close.assert_called_once()
+
+
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_user_agent_is_deterministic_per_page(
+    mock_session_class: MagicMock,
+) -> None:
+    """Test that each page request carries the User-Agent selected by its page number."""
+    from psa_squash_rankings.config import USER_AGENTS
+
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.get.side_effect = _paged_response_by_url(total=50, page_size=10)
+
+    get_rankings("male", page_size=10, resume=False)
+
+    for call in mock_session.get.call_args_list:
+        page = int(call[0][0].split("page=")[1].split("&")[0])
+        assert call[1]["headers"]["User-Agent"] == USER_AGENTS[page % len(USER_AGENTS)]
+
+
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_uses_total_pages_when_reported(
+    mock_session_class: MagicMock,
+) -> None:
+    """Test that a 'totalPages' field bounds the concurrent fetch like 'total'."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.get.side_effect = _paged_response_by_url(
+        total=35, page_size=10, report_pages=True
+    )
+
+    result = get_rankings("male", page_size=10, resume=False)
+
+    assert mock_session.get.call_count == 4
+    assert [record["rank"] for record in result] == list(range(1, 36))
+
+
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_total_known_respects_max_pages(
+    mock_session_class: MagicMock,
+) -> None:
+    """Test that max_pages still bounds the pages requested when total is known."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.get.side_effect = _paged_response_by_url(total=100, page_size=10)
+
+    result = get_rankings("male", page_size=10, max_pages=3, resume=False)
+
+    assert mock_session.get.call_count == 3
+    assert len(result) == 30
+    mock_session.close.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "field, headers",
+    [
+        ("pageCount", {}),
+        ("totalCount", {}),
+        (None, {"X-Total-Pages": "4"}),
+        (None, {"X-Total-Count": "40"}),
+    ],
+)
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_reads_alternate_size_fields(
+    mock_session_class: MagicMock,
+    field: Any,
+    headers: dict[str, str],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that other page-count/total fields and X-Total-* headers are read."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    serve = _paged_response_by_url(total=40, page_size=10)
+
+    def _get(url: str, **kwargs) -> Mock:
+        response = serve(url, **kwargs)
+        body = response.json.return_value
+        del body["total"]
+        if field == "pageCount":
+            body[field] = 4
+        elif field == "totalCount":
+            body[field] = 40
+        response.headers = headers
+        return response
+
+    mock_session.get.side_effect = _get
+
+    with caplog.at_level("INFO", logger="psa_squash_rankings.api_scraper"):
+        result = get_rankings("male", page_size=10, resume=False)
+
+    # Only a size read from the response switches to concurrent fetching
+    assert "Fetching pages 2-4 concurrently" in caplog.text
+    assert mock_session.get.call_count == 4
+    assert [record["rank"] for record in result] == list(range(1, 41))
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"X-Total-Pages": "inf"},
+        {"X-Total-Pages": "nan"},
+        {"X-Total-Count": "inf", "Retry-After": "inf"},
+    ],
+)
+@patch("psa_squash_rankings.api_scraper.time.sleep")
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_ignores_non_finite_size_headers(
+    mock_session_class: MagicMock,
+    mock_sleep: MagicMock,
+    headers: dict[str, str],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that inf/nan header values are ignored instead of crashing the scrape."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    serve = _paged_response_by_url(total=40, page_size=10)
+
+    def _get(url: str, **kwargs) -> Mock:
+        response = serve(url, **kwargs)
+        del response.json.return_value["total"]
+        response.headers = headers
+        return response
+
+    mock_session.get.side_effect = _get
+
+    with caplog.at_level("INFO", logger="psa_squash_rankings.api_scraper"):
+        result = get_rankings("male", page_size=10, resume=False)
+
+    assert "concurrently" not in caplog.text
+    assert [record["rank"] for record in result] == list(range(1, 41))
+    mock_sleep.assert_not_called()
+
+
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_continues_past_understated_page_count(
+    mock_session_class: MagicMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that a full last page with hasMore=True outlives a stale page count."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    serve = _paged_response_by_url(total=45, page_size=10)
+
+    def _get(url: str, **kwargs) -> Mock:
+        response = serve(url, **kwargs)
+        body = response.json.return_value
+        del body["total"]
+        body["totalPages"] = 2
+        return response
+
+    mock_session.get.side_effect = _get
+
+    with caplog.at_level("WARNING", logger="psa_squash_rankings.api_scraper"):
+        result = get_rankings("male", page_size=10, resume=False)
+
+    assert [record["rank"] for record in result] == list(range(1, 46))
+    assert mock_session.get.call_count == 5
+    assert "API reported 2 pages" in caplog.text
+    assert caplog.text.count("continuing page by page") == 1
+
+
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_concurrent_page_error_propagates(
+    mock_session_class: MagicMock,
+) -> None:
+    """Test that an error on a concurrently fetched page propagates and closes the session."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    serve_page = _paged_response_by_url(total=30, page_size=10)
+
+    def _get(url: str, **kwargs) -> Mock:
+        if "page=3&" in url:
+            raise requests.exceptions.ConnectionError("Connection reset")
+        return serve_page(url, **kwargs)
+
+    mock_session.get.side_effect = _get
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        get_rankings("male", page_size=10, resume=False)
+
+    mock_session.close.assert_called_once()
+
+
 @patch("psa_squash_rankings.api_scraper.requests.Session")
 def test_get_rankings_returns_api_player_record_type(
     mock_session_class: MagicMock,
@@ -458,6 +717,462 @@ def test_get_rankings_returns_api_player_record_type(
     assert record["source"] == "api"
 
 
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_resumes_from_appended_checkpoint(
+    mock_session_class: MagicMock, tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a failed scrape checkpoints its pages and a rerun resumes after them."""
+    monkeypatch.setattr("psa_squash_rankings.api_scraper.CHECKPOINT_DIR", tmp_path)
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    serve_page = _paged_response_by_url(total=40, page_size=10)
+
+    def _fail_on_page_3(url: str, **kwargs) -> Mock:
+        if "page=3&" in url:
+            raise requests.exceptions.ConnectionError("Connection reset")
+        return serve_page(url, **kwargs)
+
+    mock_session.get.side_effect = _fail_on_page_3
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        get_rankings("male", page_size=10, resume=True)
+
+    assert (tmp_path / "male_checkpoint.jsonl").read_text().count("\n") == 20
+
+    mock_session.get.reset_mock()
+    mock_session.get.side_effect = serve_page
+
+    result = get_rankings("male", page_size=10, resume=True)
+
+    assert mock_session.get.call_count == 2
+    assert [record["rank"] for record in result] == list(range(1, 41))
+    assert not (tmp_path / "male_checkpoint.json").exists()
+    assert not (tmp_path / "male_checkpoint.jsonl").exists()
+
+
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_parse_failure_checkpoints_only_parsed_pages(
+    mock_session_class: MagicMock, tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a page failing to parse is not marked done in the checkpoint."""
+    monkeypatch.setattr("psa_squash_rankings.api_scraper.CHECKPOINT_DIR", tmp_path)
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    serve_page = _paged_response_by_url(total=40, page_size=10)
+
+    def _bad_record_on_page_3(url: str, **kwargs) -> Mock:
+        response = serve_page(url, **kwargs)
+        if "page=3&" in url:
+            del response.json.return_value["players"][0]["Id"]
+        return response
+
+    mock_session.get.side_effect = _bad_record_on_page_3
+
+    with pytest.raises(ValueError):
+        get_rankings("male", page_size=10, resume=True)
+
+    meta = json.loads((tmp_path / "male_checkpoint.json").read_text())
+    assert meta["last_page"] == 2
+    assert meta["total_players"] == 20
+
+    mock_session.get.reset_mock()
+    mock_session.get.side_effect = serve_page
+
+    result = get_rankings("male", page_size=10, resume=True)
+
+    requested = [c.args[0] for c in mock_session.get.call_args_list]
+    assert "page=3&" in requested[0]
+    assert [record["rank"] for record in result] == list(range(1, 41))
+
+
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_failure_after_resume_reports_existing_checkpoint(
+    mock_session_class: MagicMock,
+    tmp_path,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that a resumed run failing straight away points at the existing checkpoint."""
+    monkeypatch.setattr("psa_squash_rankings.api_scraper.CHECKPOINT_DIR", tmp_path)
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    serve_page = _paged_response_by_url(total=40, page_size=10)
+
+    def _fail_from_page_3(url: str, **kwargs) -> Mock:
+        if "page=1&" not in url and "page=2&" not in url:
+            raise requests.exceptions.ConnectionError("Connection reset")
+        return serve_page(url, **kwargs)
+
+    mock_session.get.side_effect = _fail_from_page_3
+    with pytest.raises(requests.exceptions.ConnectionError):
+        get_rankings("male", page_size=10, resume=True)
+
+    caplog.clear()
+    with caplog.at_level("INFO", logger="psa_squash_rankings.api_scraper"):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            get_rankings("male", page_size=10, resume=True)
+
+    assert "Run again to resume from page 3." in caplog.text
+    assert "No progress to save" not in caplog.text
+
+
+@patch("psa_squash_rankings.api_scraper.save_checkpoint")
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_failed_flush_warns_without_resume_hint(
+    mock_session_class: MagicMock,
+    mock_save: MagicMock,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that a checkpoint flush failing on error is reported, not hidden."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    serve_page = _paged_response_by_url(total=40, page_size=10)
+
+    def _fail_on_page_3(url: str, **kwargs) -> Mock:
+        if "page=3&" in url:
+            raise requests.exceptions.ConnectionError("Connection reset")
+        return serve_page(url, **kwargs)
+
+    mock_session.get.side_effect = _fail_on_page_3
+    mock_save.side_effect = OSError("disk full")
+
+    with caplog.at_level("INFO", logger="psa_squash_rankings.api_scraper"):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            get_rankings("male", page_size=10, resume=False)
+
+    assert "Error on page 3: Connection reset" in caplog.text
+    assert "Could not checkpoint pages 1-2 (disk full)" in caplog.text
+    assert "Run again to resume" not in caplog.text
+
+
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_stop_event_checkpoints_and_interrupts(
+    mock_session_class: MagicMock, tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that setting stop ends the scrape at the next page, keeping progress."""
+    monkeypatch.setattr("psa_squash_rankings.api_scraper.CHECKPOINT_DIR", tmp_path)
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.get.side_effect = _paged_response_by_url(total=40, page_size=10)
+    stop = threading.Event()
+
+    def _parse_then_stop(player: dict[str, Any]):
+        stop.set()
+        return parse_api_player(player)
+
+    monkeypatch.setattr(
+        "psa_squash_rankings.api_scraper.parse_api_player", _parse_then_stop
+    )
+
+    with pytest.raises(KeyboardInterrupt):
+        get_rankings("male", page_size=10, resume=True, stop=stop)
+
+    meta = json.loads((tmp_path / "male_checkpoint.json").read_text())
+    assert meta == {"gender": "male", "last_page": 1, "total_players": 10}
+
+
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_iter_ranking_pages_stops_between_pages(
+    mock_session_class: MagicMock,
+) -> None:
+    """Test that a set stop event interrupts iteration before the next page."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.get.side_effect = _paged_response_by_url(total=25, page_size=10)
+    stop = threading.Event()
+
+    pages = iter_ranking_pages("male", page_size=10, stop=stop)
+    assert len(next(pages)) == 10
+    stop.set()
+
+    with pytest.raises(KeyboardInterrupt):
+        next(pages)
+    mock_session.close.assert_called_once()
+
+
+@patch("psa_squash_rankings.api_scraper.append_checkpoint")
+@patch("psa_squash_rankings.api_scraper.save_checkpoint")
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_checkpoints_every_n_pages(
+    mock_session_class: MagicMock,
+    mock_save: MagicMock,
+    mock_append: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that checkpoints are batched instead of written after every page."""
+    monkeypatch.setattr("psa_squash_rankings.api_scraper.CHECKPOINT_EVERY_N_PAGES", 2)
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.get.side_effect = _paged_response_by_url(total=50, page_size=10)
+    saved: list[tuple[int, int]] = []
+    mock_save.side_effect = lambda gender, page, data: saved.append((page, len(data)))
+
+    get_rankings("male", page_size=10, resume=False)
+
+    assert saved == [(2, 20)]
+    mock_append.assert_called_once()
+    assert mock_append.call_args[0][1] == 4
+    assert len(mock_append.call_args[0][2]) == 20
+    assert mock_append.call_args[0][3] == 40
+
+
+@patch("psa_squash_rankings.api_scraper.append_checkpoint")
+@patch("psa_squash_rankings.api_scraper.save_checkpoint")
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_checkpoint_every_overrides_default(
+    mock_session_class: MagicMock,
+    mock_save: MagicMock,
+    mock_append: MagicMock,
+) -> None:
+    """Test that checkpoint_every sets how many pages go between checkpoints."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.get.side_effect = _paged_response_by_url(total=30, page_size=10)
+
+    get_rankings("male", page_size=10, resume=False, checkpoint_every=1)
+
+    assert [c.args[1] for c in mock_save.call_args_list] == [1]
+    assert [c.args[1] for c in mock_append.call_args_list] == [2, 3]
+
+
+@pytest.mark.parametrize("checkpoint_every", [0, -1])
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_rejects_checkpoint_every_below_one(
+    mock_session_class: MagicMock, checkpoint_every: int
+) -> None:
+    """Test that a checkpoint interval below 1 fails before any request is made."""
+    with pytest.raises(ValueError, match="checkpoint_every"):
+        get_rankings("male", resume=False, checkpoint_every=checkpoint_every)
+
+    mock_session_class.assert_not_called()
+
+
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_flushes_checkpoint_on_keyboard_interrupt(
+    mock_session_class: MagicMock, tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that progress since the last checkpoint survives a KeyboardInterrupt."""
+    monkeypatch.setattr("psa_squash_rankings.api_scraper.CHECKPOINT_DIR", tmp_path)
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+
+    page1_response = Mock()
+    page1_response.raise_for_status = Mock()
+    page1_response.json.return_value = {
+        "players": [
+            {
+                "World Ranking": i,
+                "Name": f"Player {i}",
+                "Id": 1000 + i,
+                "Tournaments": 10,
+                "Total Points": 10000 - i,
+            }
+            for i in range(1, 11)
+        ],
+        "hasMore": True,
+    }
+    mock_session.get.side_effect = [page1_response, KeyboardInterrupt()]
+
+    with pytest.raises(KeyboardInterrupt):
+        get_rankings("male", page_size=10, resume=True)
+
+    mock_session.close.assert_called_once()
+    meta = json.loads((tmp_path / "male_checkpoint.json").read_text())
+    assert meta["last_page"] == 1
+    assert meta["total_players"] == 10
+
+
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_iter_ranking_pages_yields_parsed_pages(
+    mock_session_class: MagicMock, tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that pages are yielded one at a time without writing checkpoints."""
+    monkeypatch.setattr("psa_squash_rankings.api_scraper.CHECKPOINT_DIR", tmp_path)
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.get.side_effect = _paged_response_by_url(total=25, page_size=10)
+
+    pages = list(iter_ranking_pages("male", page_size=10))
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert pages[2][-1]["rank"] == 25
+    assert all(record["source"] == "api" for page in pages for record in page)
+    assert list(tmp_path.iterdir()) == []
+    mock_session.close.assert_called_once()
+
+
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_iter_ranking_pages_closes_session_when_abandoned(
+    mock_session_class: MagicMock,
+) -> None:
+    """Test that stopping iteration early still closes the session."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.get.side_effect = _paged_response_by_url(total=25, page_size=10)
+
+    pages = iter_ranking_pages("male", page_size=10)
+    first_page = next(pages)
+    pages.close()
+
+    assert len(first_page) == 10
+    mock_session.close.assert_called_once()
+
+
+def _sequential_page(first: int, count: int, has_more: bool, headers=None) -> Mock:
+    response = Mock()
+    response.raise_for_status = Mock()
+    response.headers = headers or {}
+    response.json.return_value = {
+        "players": [
+            {
+                "World Ranking": i,
+                "Name": f"Player {i}",
+                "Id": 1000 + i,
+                "Tournaments": 10,
+                "Total Points": 10000 - i,
+            }
+            for i in range(first, first + count)
+        ],
+        "hasMore": has_more,
+    }
+    return response
+
+
+@patch("psa_squash_rankings.api_scraper.time.sleep")
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_waits_for_exhausted_rate_limit(
+    mock_session_class: MagicMock, mock_sleep: MagicMock
+) -> None:
+    """Test that an exhausted rate-limit budget pauses the next request until reset."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.get.side_effect = [
+        _sequential_page(
+            1, 10, True, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"}
+        ),
+        _sequential_page(11, 10, False),
+    ]
+
+    result = get_rankings("male", page_size=10, resume=False)
+
+    assert len(result) == 20
+    mock_sleep.assert_called_once()
+    assert 2.5 < mock_sleep.call_args[0][0] <= 3
+
+
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_iter_ranking_pages_prefetches_next_page(
+    mock_session_class: MagicMock,
+) -> None:
+    """Test that the next page is requested before the current one is consumed."""
+    page2_requested = threading.Event()
+    responses = iter([_sequential_page(1, 10, True), _sequential_page(11, 10, False)])
+
+    def fake_get(url, **kwargs):
+        if "page=2" in url:
+            page2_requested.set()
+        return next(responses)
+
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.get.side_effect = fake_get
+
+    pages = iter_ranking_pages("male", page_size=10)
+    first_page = next(pages)
+
+    assert page2_requested.wait(timeout=5)
+    assert len(first_page) == 10
+    assert [len(page) for page in pages] == [10]
+    assert mock_session.get.call_count == 2
+
+
+@patch("psa_squash_rankings.api_scraper.time.sleep")
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_caps_retry_after_wait(
+    mock_session_class: MagicMock, mock_sleep: MagicMock
+) -> None:
+    """Test that Retry-After pauses are capped at RATE_LIMIT_MAX_WAIT."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.get.side_effect = [
+        _sequential_page(1, 10, True, {"Retry-After": "3600"}),
+        _sequential_page(11, 10, False),
+    ]
+
+    get_rankings("male", page_size=10, resume=False)
+
+    mock_sleep.assert_called_once()
+    assert mock_sleep.call_args[0][0] <= 60
+
+
+@patch("psa_squash_rankings.api_scraper.time.sleep")
+@patch("psa_squash_rankings.api_scraper.requests.Session")
+def test_get_rankings_does_not_wait_with_budget_remaining(
+    mock_session_class: MagicMock, mock_sleep: MagicMock
+) -> None:
+    """Test that requests are not throttled while the budget is positive."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+    mock_session.get.side_effect = [
+        _sequential_page(
+            1, 10, True, {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "3"}
+        ),
+        _sequential_page(11, 10, False),
+    ]
+
+    get_rankings("male", page_size=10, resume=False)
+
+    mock_sleep.assert_not_called()
+
+
+def test_get_rankings_reuses_caller_session() -> None:
+    """Test that a caller-supplied session is used for every page and left open."""
+    session = MagicMock()
+    session.get.side_effect = _paged_response_by_url(total=25, page_size=10)
+
+    with patch(
+        "psa_squash_rankings.api_scraper.requests.Session"
+    ) as mock_session_class:
+        result = get_rankings("male", page_size=10, resume=False, session=session)
+
+    assert len(result) == 25
+    assert session.get.call_count == 3
+    session.close.assert_not_called()
+    mock_session_class.assert_not_called()
+
+
+def test_make_session_mounts_pooled_adapter_with_retries() -> None:
+    """Test that sessions reuse pooled connections and retry transient statuses."""
+    session = make_session()
+    try:
+        adapter = session.get_adapter("https://psa-api.ptsportsuite.com/")
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_maxsize >= 8
+        assert adapter.max_retries.total == 5
+        assert 503 in adapter.max_retries.status_forcelist
+        assert adapter.max_retries.respect_retry_after_header
+        assert adapter.max_retries.allowed_methods == frozenset({"GET", "HEAD"})
+    finally:
+        session.close()
+
+
+@patch("urllib3.util.retry.time.sleep")
+def test_make_session_caps_retry_after_sleeps(mock_sleep: MagicMock) -> None:
+    """Test that the session retry policy never sleeps past RATE_LIMIT_MAX_WAIT."""
+    session = make_session()
+    try:
+        adapter = session.get_adapter("https://psa-api.ptsportsuite.com/")
+        assert isinstance(adapter, HTTPAdapter)
+        retry = adapter.max_retries
+        response = Mock(status=429, headers={"Retry-After": "3600"})
+        retry = retry.increment(method="GET", url="/", response=response)
+        assert retry.get_retry_after(response) == RATE_LIMIT_MAX_WAIT
+        retry.sleep(response)
+        mock_sleep.assert_called_once_with(RATE_LIMIT_MAX_WAIT)
+    finally:
+        session.close()
+
+
 # ---------------------------------------------------------------------------
 # Tests for get_player_bio
 # ---------------------------------------------------------------------------
@@ -628,3 +1343,13 @@ def test_get_player_bio_http_error_propagates(mock_session_class: MagicMock) ->
         get_player_bio(11942)
 
     mock_session.close.assert_called_once()
+
+
+def test_importing_api_scraper_does_not_import_pandas() -> None:
+    """Test that the scraper's import chain (data_parser -> validator) skips pandas."""
+    code = "import sys, psa_squash_rankings.api_scraper; print('pandas' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
@@ -6,6 +6,7 @@ import json
 import pytest
 from pathlib import Path
 from psa_squash_rankings.api_scraper import (
+    append_checkpoint,
     save_checkpoint,
     load_checkpoint,
     clear_checkpoint,
@@ -51,7 +52,9 @@ def test_save_checkpoint(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Non
     save_checkpoint("male", 5, test_data)
 
     checkpoint_file = tmp_path / "male_checkpoint.json"
+    players_file = tmp_path / "male_checkpoint.jsonl"
     assert checkpoint_file.exists()
+    assert players_file.exists()
 
     with open(checkpoint_file, "r") as f:
         saved_data = json.load(f)
@@ -59,7 +62,15 @@ def test_save_checkpoint(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Non
     assert saved_data["gender"] == "male"
     assert saved_data["last_page"] == 5
     assert saved_data["total_players"] == 2
-    assert saved_data["players"] == test_data
+    assert "players" not in saved_data
+
+    with open(players_file, "r") as f:
+        saved_players = [json.loads(line) for line in f]
+
+    assert saved_players == test_data
+    loaded = load_checkpoint("male")
+    assert loaded is not None
+    assert loaded["players"] == test_data
 
 
 def test_load_checkpoint_exists(
@@ -142,10 +153,13 @@ def test_clear_checkpoint(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> No
     save_checkpoint("male", 1, test_data)
 
     checkpoint_file = tmp_path / "male_checkpoint.json"
+    players_file = tmp_path / "male_checkpoint.jsonl"
     assert checkpoint_file.exists()
+    assert players_file.exists()
 
     clear_checkpoint("male")
     assert not checkpoint_file.exists()
+    assert not players_file.exists()
 
 
 def test_clear_checkpoint_not_exists(
@@ -297,3 +311,153 @@ def test_checkpoint_large_dataset(
     assert len(loaded["players"]) == 500
     assert loaded["players"][0]["rank"] == 1
     assert loaded["players"][-1]["rank"] == 500
+
+
+def _make_players(start: int, stop: int) -> list[ApiPlayerRecord]:
+    return [
+        {
+            "rank": i,
+            "player": f"Player {i}",
+            "id": i,
+            "tournaments": 10,
+            "points": 10000 - i,
+            "height_cm": None,
+            "weight_kg": None,
+            "birthdate": None,
+            "country": None,
+            "picture_url": None,
+            "mugshot_url": None,
+            "source": "api",
+        }
+        for i in range(start, stop)
+    ]
+
+
+def test_append_checkpoint_extends_saved_players(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that appended pages are loaded after the initially saved players."""
+    monkeypatch.setattr("psa_squash_rankings.api_scraper.CHECKPOINT_DIR", tmp_path)
+
+    save_checkpoint("male", 1, _make_players(1, 11))
+    append_checkpoint("male", 2, _make_players(11, 21), 20)
+    append_checkpoint("male", 3, _make_players(21, 26), 25)
+
+    loaded = load_checkpoint("male")
+
+    assert loaded is not None
+    assert loaded["last_page"] == 3
+    assert loaded["total_players"] == 25
+    assert [p["rank"] for p in loaded["players"]] == list(range(1, 26))
+
+
+def test_load_checkpoint_ignores_unrecorded_tail(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that lines past the recorded total (e.g. a torn append) are ignored."""
+    monkeypatch.setattr("psa_squash_rankings.api_scraper.CHECKPOINT_DIR", tmp_path)
+
+    save_checkpoint("male", 1, _make_players(1, 4))
+    with open(tmp_path / "male_checkpoint.jsonl", "a") as f:
+        f.write('{"rank": 4, "player": "Tor')
+
+    loaded = load_checkpoint("male")
+
+    assert loaded is not None
+    assert loaded["total_players"] == 3
+    assert [p["rank"] for p in loaded["players"]] == [1, 2, 3]
+
+
+def test_load_checkpoint_missing_players_returns_none(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a checkpoint whose player log is short is treated as unusable."""
+    monkeypatch.setattr("psa_squash_rankings.api_scraper.CHECKPOINT_DIR", tmp_path)
+
+    save_checkpoint("male", 1, _make_players(1, 4))
+    (tmp_path / "male_checkpoint.jsonl").unlink()
+
+    assert load_checkpoint("male") is None
+
+
+def test_load_checkpoint_reads_single_file_format(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a checkpoint with embedded players and no .jsonl still resumes."""
+    monkeypatch.setattr("psa_squash_rankings.api_scraper.CHECKPOINT_DIR", tmp_path)
+    players = _make_players(1, 4)
+    legacy = {
+        "gender": "male",
+        "last_page": 1,
+        "total_players": len(players),
+        "players": players,
+    }
+    (tmp_path / "male_checkpoint.json").write_text(json.dumps(legacy, indent=2))
+
+    loaded = load_checkpoint("male")
+
+    assert loaded is not None
+    assert loaded["last_page"] == 1
+    assert loaded["players"] == players
+
+
+def test_append_after_single_file_checkpoint_converts_it(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that resuming from the single-file format and saving keeps every player."""
+    monkeypatch.setattr("psa_squash_rankings.api_scraper.CHECKPOINT_DIR", tmp_path)
+    legacy = {
+        "gender": "male",
+        "last_page": 1,
+        "total_players": 3,
+        "players": _make_players(1, 4),
+    }
+    (tmp_path / "male_checkpoint.json").write_text(json.dumps(legacy))
+
+    loaded = load_checkpoint("male")
+    assert loaded is not None
+    save_checkpoint("male", 2, loaded["players"] + _make_players(4, 7))
+
+    reloaded = load_checkpoint("male")
+    assert reloaded is not None
+    assert reloaded["last_page"] == 2
+    assert [p["rank"] for p in reloaded["players"]] == list(range(1, 7))
+    assert "players" not in json.loads((tmp_path / "male_checkpoint.json").read_text())
+
+
+def test_save_checkpoint_leaves_no_temporary_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that rewritten files are renamed into place rather than left as temp files."""
+    monkeypatch.setattr("psa_squash_rankings.api_scraper.CHECKPOINT_DIR", tmp_path)
+
+    save_checkpoint("male", 1, _make_players(1, 11))
+    append_checkpoint("male", 2, _make_players(11, 21), 20)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "male_checkpoint.json",
+        "male_checkpoint.jsonl",
+    ]
+
+
+def test_failed_checkpoint_rewrite_keeps_previous_checkpoint(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a full rewrite failing mid-write leaves the old checkpoint loadable."""
+    monkeypatch.setattr("psa_squash_rankings.api_scraper.CHECKPOINT_DIR", tmp_path)
+
+    save_checkpoint("male", 1, _make_players(1, 4))
+
+    def _failing_records():
+        yield from _make_players(4, 6)
+        raise OSError("disk full")
+
+    with pytest.raises(OSError, match="disk full"):
+        save_checkpoint("male", 2, _failing_records())  # type: ignore[arg-type]
+
+    loaded = load_checkpoint("male")
+
+    assert loaded is not None
+    assert loaded["last_page"] == 1
+    assert [p["rank"] for p in loaded["players"]] == [1, 2, 3]
+    assert not list(tmp_path.glob("*.tmp"))
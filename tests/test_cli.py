@@ -6,12 +6,14 @@ OUTPUT_DIR is redirected to tmp_path for every test.
 """
 
 import sys
+import threading
 import pytest
 import pandas as pd
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from psa_squash_rankings.cli import main
+from psa_squash_rankings.config import HTML_CACHE_DIR
 
 
 # ---------------------------------------------------------------------------
@@ -132,6 +134,102 @@ class TestRankingsCommand:
                 _run(["rankings", "--gender", "both"], tmp_path, monkeypatch)
         assert mock_get.call_count == 2
 
+    def test_both_genders_share_one_api_session(self, tmp_path, monkeypatch):
+        with patch(
+            "psa_squash_rankings.cli.get_rankings", return_value=[SAMPLE_API_PLAYER]
+        ) as mock_get:
+            with patch("psa_squash_rankings.cli.export_to_csv"):
+                _run(["rankings", "--gender", "both"], tmp_path, monkeypatch)
+        sessions = [call.kwargs["session"] for call in mock_get.call_args_list]
+        assert sessions[0] is not None
+        assert sessions[0] is sessions[1]
+
+    def test_both_genders_scrape_concurrently(self, tmp_path, monkeypatch):
+        # Each call waits for the other; a sequential loop would break the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_get_rankings(**kwargs):
+            barrier.wait()
+            return [SAMPLE_API_PLAYER]
+
+        with patch(
+            "psa_squash_rankings.cli.get_rankings", side_effect=fake_get_rankings
+        ):
+            with patch("psa_squash_rankings.cli.export_to_csv") as mock_export:
+                code = _run(["rankings", "--gender", "both"], tmp_path, monkeypatch)
+        assert code == 0
+        filenames = sorted(call.args[1] for call in mock_export.call_args_list)
+        assert filenames == ["psa_rankings_female.csv", "psa_rankings_male.csv"]
+
+    def test_checkpoint_every_passed_through(self, tmp_path, monkeypatch):
+        with patch(
+            "psa_squash_rankings.cli.get_rankings", return_value=[SAMPLE_API_PLAYER]
+        ) as mock_get:
+            with patch("psa_squash_rankings.cli.export_to_csv"):
+                _run(
+                    ["rankings", "--gender", "male", "--checkpoint-every", "2"],
+                    tmp_path,
+                    monkeypatch,
+                )
+        assert mock_get.call_args.kwargs["checkpoint_every"] == 2
+
+    @pytest.mark.parametrize("value", ["0", "-3", "abc"])
+    def test_checkpoint_every_rejects_values_below_one(
+        self, value, tmp_path, monkeypatch, capsys
+    ):
+        with patch("psa_squash_rankings.cli.get_rankings") as mock_get:
+            with pytest.raises(SystemExit) as exc_info:
+                _run(
+                    ["rankings", "--gender", "male", "--checkpoint-every", value],
+                    tmp_path,
+                    monkeypatch,
+                )
+        assert exc_info.value.code == 2
+        assert "--checkpoint-every" in capsys.readouterr().err
+        mock_get.assert_not_called()
+
+    def test_single_gender_runs_on_main_thread(self, tmp_path, monkeypatch):
+        threads = []
+
+        def fake_get_rankings(**kwargs):
+            threads.append(threading.current_thread())
+            return [SAMPLE_API_PLAYER]
+
+        with patch(
+            "psa_squash_rankings.cli.get_rankings", side_effect=fake_get_rankings
+        ):
+            with patch("psa_squash_rankings.cli.export_to_csv"):
+                _run(["rankings", "--gender", "male"], tmp_path, monkeypatch)
+        assert threads == [threading.main_thread()]
+
+    def test_interrupt_stops_other_gender_without_exporting(
+        self, tmp_path, monkeypatch
+    ):
+        stopped = threading.Event()
+
+        def fake_get_rankings(gender, stop, **kwargs):
+            if gender == "male":
+                raise KeyboardInterrupt
+            # The female scrape would run for 5s unless told to stop
+            if stop.wait(timeout=5):
+                stopped.set()
+                raise KeyboardInterrupt
+            return [SAMPLE_API_PLAYER]
+
+        api_session = MagicMock()
+        with patch(
+            "psa_squash_rankings.cli.make_api_session", return_value=api_session
+        ):
+            with patch(
+                "psa_squash_rankings.cli.get_rankings", side_effect=fake_get_rankings
+            ):
+                with patch("psa_squash_rankings.cli.export_to_csv") as mock_export:
+                    with pytest.raises(KeyboardInterrupt):
+                        _run(["rankings", "--gender", "both"], tmp_path, monkeypatch)
+        assert stopped.is_set()
+        mock_export.assert_not_called()
+        api_session.close.assert_called_once()
+
     def test_api_failure_falls_back_to_html(self, tmp_path, monkeypatch):
         html_player = {
             "rank": 1,
@@ -152,6 +250,46 @@ class TestRankingsCommand:
                     code = _run(["rankings", "--gender", "male"], tmp_path, monkeypatch)
         assert code == 0
 
+    def test_html_fallbacks_share_one_session(self, tmp_path, monkeypatch):
+        html_player = {
+            "rank": 1,
+            "player": "Paul Coll",
+            "tournaments": 10,
+            "points": 18000,
+            "mugshot_url": None,
+            "source": "html",
+        }
+        with patch(
+            "psa_squash_rankings.cli.get_rankings", side_effect=Exception("API down")
+        ):
+            with patch(
+                "psa_squash_rankings.cli.scrape_rankings_html",
+                return_value=[html_player],
+            ) as mock_html:
+                with patch("psa_squash_rankings.cli.export_to_csv"):
+                    code = _run(["rankings", "--gender", "both"], tmp_path, monkeypatch)
+        assert code == 0
+        sessions = [call.kwargs["session"] for call in mock_html.call_args_list]
+        assert len(sessions) == 2
+        assert sessions[0] is not None
+        assert sessions[0] is sessions[1]
+        cache_dirs = {call.kwargs["cache_dir"] for call in mock_html.call_args_list}
+        assert cache_dirs == {HTML_CACHE_DIR}
+
+    def test_clear_html_cache_flag(self, tmp_path, monkeypatch):
+        with patch(
+            "psa_squash_rankings.cli.get_rankings", return_value=[SAMPLE_API_PLAYER]
+        ):
+            with patch("psa_squash_rankings.cli.export_to_csv"):
+                with patch("psa_squash_rankings.cli.clear_html_cache") as mock_clear:
+                    code = _run(
+                        ["rankings", "--gender", "male", "--clear-html-cache"],
+                        tmp_path,
+                        monkeypatch,
+                    )
+        assert code == 0
+        mock_clear.assert_called_once_with(HTML_CACHE_DIR)
+
     def test_both_sources_fail_returns_1(self, tmp_path, monkeypatch):
         with patch(
             "psa_squash_rankings.cli.get_rankings", side_effect=Exception("API down")
@@ -171,6 +309,37 @@ class TestRankingsCommand:
                 _run([], tmp_path, monkeypatch)
         assert mock_get.called
 
+    def test_stream_writes_pages_without_get_rankings(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("psa_squash_rankings.exporter.OUTPUT_DIR", tmp_path)
+        with patch(
+            "psa_squash_rankings.cli.iter_ranking_pages",
+            return_value=iter([[SAMPLE_API_PLAYER], [SAMPLE_API_PLAYER]]),
+        ) as mock_iter:
+            with patch("psa_squash_rankings.cli.get_rankings") as mock_get:
+                code = _run(
+                    ["rankings", "--gender", "male", "--stream"], tmp_path, monkeypatch
+                )
+        assert code == 0
+        assert not mock_get.called
+        assert mock_iter.call_args.kwargs["session"] is not None
+        df = pd.read_csv(tmp_path / "psa_rankings_male.csv")
+        assert len(df) == 2
+        assert df["player"].tolist() == ["Paul Coll", "Paul Coll"]
+
+    def test_stream_rejects_checkpoint_every(self, tmp_path, monkeypatch, capsys):
+        with patch("psa_squash_rankings.cli.iter_ranking_pages") as mock_iter:
+            with pytest.raises(SystemExit) as exc_info:
+                _run(
+                    ["rankings", "--stream", "--checkpoint-every", "2"],
+                    tmp_path,
+                    monkeypatch,
+                )
+        assert exc_info.value.code == 2
+        assert "--checkpoint-every cannot be used with --stream" in (
+            capsys.readouterr().err
+        )
+        mock_iter.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # tournaments subcommand
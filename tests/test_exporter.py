@@ -2,10 +2,19 @@
 Test suite for exporter functionality.
 """
 
+import subprocess
+import sys
+
 import pytest
 from unittest.mock import patch
 from pathlib import Path
-from psa_squash_rankings.exporter import export_to_csv
+from typing import Any
+from psa_squash_rankings.exporter import (
+    export_to_csv,
+    export_pages_to_csv,
+    records_to_frame,
+    concat_pages,
+)
 from psa_squash_rankings.schema import ApiPlayerRecord, HtmlPlayerRecord
 
 
@@ -161,11 +170,32 @@ def test_export_to_csv_correct_content_html(
 def test_export_to_csv_empty_data(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    """Test exporting empty data."""
+    """Test exporting empty data returns without creating a file."""
     monkeypatch.setattr("psa_squash_rankings.exporter.OUTPUT_DIR", tmp_path)
 
     filename = "test_rankings.csv"
-    export_to_csv([], filename)
+    with patch("psa_squash_rankings.exporter.open") as mock_open:
+        export_to_csv([], filename)
+
+    mock_open.assert_not_called()
+    assert not (tmp_path / filename).exists()
+
+
+def test_export_to_csv_writes_header_order_and_blank_nones(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    sample_html_data: list[HtmlPlayerRecord],
+) -> None:
+    """Test the raw CSV: columns in record key order, None as an empty field."""
+    monkeypatch.setattr("psa_squash_rankings.exporter.OUTPUT_DIR", tmp_path)
+
+    export_to_csv(sample_html_data, "raw.csv")
+
+    assert (tmp_path / "raw.csv").read_text(encoding="utf-8").splitlines() == [
+        "rank,player,tournaments,points,mugshot_url,source",
+        "1,Ali Farag,12,20000,,html",
+        "2,Paul Coll,10,18000,,html",
+    ]
 
 
 def test_export_to_csv_overwrites_existing(
@@ -210,6 +240,28 @@ def test_export_to_csv_overwrites_existing(
     assert df_read.iloc[0]["points"] == 999999
 
 
+def test_export_to_csv_keeps_integer_columns_with_missing_values(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    sample_api_data: list[ApiPlayerRecord],
+) -> None:
+    """Test that missing height/weight values don't turn integers into floats."""
+    monkeypatch.setattr("psa_squash_rankings.exporter.OUTPUT_DIR", tmp_path)
+
+    sample_api_data[1]["height_cm"] = None
+    sample_api_data[1]["weight_kg"] = None
+
+    filename = "test_rankings.csv"
+    export_to_csv(sample_api_data, filename)
+
+    lines = (tmp_path / filename).read_text(encoding="utf-8").splitlines()
+
+    assert lines[0].split(",")[:4] == ["rank", "player", "id", "tournaments"]
+    assert "180,75" in lines[1]
+    assert ".0" not in lines[1]
+    assert "Paul Coll,67890,10,18000,1992-06-14,,," in lines[2]
+
+
 def test_export_to_csv_different_filenames(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -301,3 +353,133 @@ def test_export_to_csv_logs_warning_html(
 
         warning_calls = [call[0][0] for call in mock_logger.warning.call_args_list]
         assert any("DEGRADED" in call for call in warning_calls)
+
+
+def test_concat_pages_combines_frames_once(
+    sample_api_data: list[ApiPlayerRecord],
+) -> None:
+    """Test that per-page frames are combined in order with a fresh index."""
+    frames = [
+        records_to_frame(sample_api_data[:2]),
+        records_to_frame(sample_api_data[2:]),
+    ]
+
+    df = concat_pages(frames)
+
+    assert list(df["rank"]) == [1, 2, 3]
+    assert list(df.index) == [0, 1, 2]
+    assert str(df["id"].dtype) == "Int64"
+
+
+def test_concat_pages_empty() -> None:
+    """Test that no pages produce an empty DataFrame."""
+    assert concat_pages([]).empty
+
+
+def test_export_pages_to_csv_streams_all_pages(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    sample_api_data: list[ApiPlayerRecord],
+) -> None:
+    """Test that pages from a generator are written in order under one header."""
+    import pandas as pd
+
+    monkeypatch.setattr("psa_squash_rankings.exporter.OUTPUT_DIR", tmp_path)
+
+    def pages():
+        yield sample_api_data[:2]
+        yield []
+        yield sample_api_data[2:]
+
+    rows = export_pages_to_csv(pages(), "streamed.csv")
+
+    df_read = pd.read_csv(tmp_path / "streamed.csv")
+    assert rows == 3
+    assert list(df_read["player"]) == ["Ali Farag", "Paul Coll", "Diego Elias"]
+    assert list(df_read.columns) == list(sample_api_data[0].keys())
+
+
+def test_export_pages_to_csv_matches_export_to_csv(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    sample_api_data: list[ApiPlayerRecord],
+) -> None:
+    """Test that streamed output is byte-identical to a single-shot export."""
+    monkeypatch.setattr("psa_squash_rankings.exporter.OUTPUT_DIR", tmp_path)
+
+    export_to_csv(sample_api_data, "single.csv")
+    export_pages_to_csv([sample_api_data[:1], sample_api_data[1:]], "paged.csv")
+
+    assert (tmp_path / "single.csv").read_bytes() == (
+        tmp_path / "paged.csv"
+    ).read_bytes()
+
+
+def test_export_pages_to_csv_no_data_creates_no_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that streaming only empty pages writes nothing."""
+    monkeypatch.setattr("psa_squash_rankings.exporter.OUTPUT_DIR", tmp_path)
+
+    assert export_pages_to_csv(iter([[], []]), "empty.csv") == 0
+    assert not (tmp_path / "empty.csv").exists()
+
+
+def test_export_pages_to_csv_single_column(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that one-field records are written as whole values, not characters."""
+    monkeypatch.setattr("psa_squash_rankings.exporter.OUTPUT_DIR", tmp_path)
+    pages: Any = [[{"player": "Ali Farag"}, {"player": "Paul Coll"}]]
+
+    assert export_pages_to_csv(pages, "single_column.csv") == 2
+    assert (tmp_path / "single_column.csv").read_text(encoding="utf-8") == (
+        "player\nAli Farag\nPaul Coll\n"
+    )
+
+
+def test_export_pages_to_csv_missing_key_writes_empty_field(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a record lacking a header key gets an empty field, not a KeyError."""
+    monkeypatch.setattr("psa_squash_rankings.exporter.OUTPUT_DIR", tmp_path)
+    pages: Any = [
+        [{"rank": 1, "player": "Ali Farag"}],
+        [{"rank": 2}, {"player": "Diego Elias", "rank": 3}],
+    ]
+
+    assert export_pages_to_csv(pages, "missing.csv") == 3
+    assert (tmp_path / "missing.csv").read_text(encoding="utf-8") == (
+        "rank,player\n1,Ali Farag\n2,\n3,Diego Elias\n"
+    )
+
+
+def test_export_pages_to_csv_failure_keeps_previous_export(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    sample_api_data: list[ApiPlayerRecord],
+) -> None:
+    """Test that a stream failing partway leaves the earlier file untouched."""
+    monkeypatch.setattr("psa_squash_rankings.exporter.OUTPUT_DIR", tmp_path)
+    export_to_csv(sample_api_data, "stream.csv")
+    previous = (tmp_path / "stream.csv").read_text(encoding="utf-8")
+
+    def pages():
+        yield sample_api_data[:1]
+        raise ConnectionError("page 2 failed")
+
+    with pytest.raises(ConnectionError):
+        export_pages_to_csv(pages(), "stream.csv")
+
+    assert (tmp_path / "stream.csv").read_text(encoding="utf-8") == previous
+    assert [p.name for p in tmp_path.iterdir()] == ["stream.csv"]
+
+
+def test_importing_cli_does_not_import_pandas() -> None:
+    """Test that pandas stays unloaded until a DataFrame is actually needed."""
+    code = "import sys, psa_squash_rankings.cli; print('pandas' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
@@ -4,7 +4,7 @@ Test suite for HTML scraper functionality in PSA Squash scraper.
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from psa_squash_rankings.html_scraper import scrape_rankings_html
+from psa_squash_rankings.html_scraper import clear_html_cache, scrape_rankings_html
 
 
 @patch("psa_squash_rankings.html_scraper.requests.Session")
@@ -471,3 +471,166 @@ def test_scrape_rankings_html_returns_html_player_record_type(
     assert "birthdate" not in record
     assert "country" not in record
     mock_session.close.assert_called_once()
+
+
+def test_scrape_rankings_html_reuses_caller_session() -> None:
+    """Test that a caller-supplied session is used and left open."""
+    session = MagicMock()
+    mock_response = Mock()
+    mock_response.text = """
+    <html>
+        <table>
+            <tbody>
+                <tr>
+                    <td>1</td>
+                    <td>Ali Farag</td>
+                    <td>12</td>
+                    <td>20,000</td>
+                </tr>
+            </tbody>
+        </table>
+    </html>
+    """
+    mock_response.raise_for_status = Mock()
+    session.get.return_value = mock_response
+
+    with patch(
+        "psa_squash_rankings.html_scraper.requests.Session"
+    ) as mock_session_class:
+        first = scrape_rankings_html(session=session)
+        second = scrape_rankings_html(session=session)
+
+    assert first == second
+    assert session.get.call_count == 2
+    session.close.assert_not_called()
+    mock_session_class.assert_not_called()
+
+
+@patch("psa_squash_rankings.html_scraper.requests.Session")
+def test_scrape_rankings_html_mugshot_and_rows_without_tbody(
+    mock_session_class: MagicMock,
+) -> None:
+    """Test mugshot extraction and direct <tr> rows when the table has no <tbody>."""
+    mock_session = MagicMock()
+    mock_session_class.return_value = mock_session
+
+    mock_response = Mock()
+    mock_response.text = """
+    <html>
+        <table>
+            <tr>
+                <td>1</td>
+                <td><a href="/players/ali-farag">Ali Farag</a></td>
+                <td>12</td>
+                <td>20,000</td>
+                <td><img class="player mugshot" src="/img/farag.jpg"></td>
+            </tr>
+            <tr>
+                <td>2</td>
+                <td>Paul Coll</td>
+                <td>10</td>
+                <td>18,000</td>
+                <td><img class="flag" src="/img/nzl.png"></td>
+            </tr>
+        </table>
+    </html>
+    """
+    mock_response.raise_for_status = Mock()
+    mock_session.get.return_value = mock_response
+
+    result = scrape_rankings_html()
+
+    assert [record["player"] for record in result] == ["Ali Farag", "Paul Coll"]
+    assert result[0]["mugshot_url"] == "/img/farag.jpg"
+    assert result[1]["mugshot_url"] is None
+
+
+RANKINGS_PAGE = """
+<html>
+    <table>
+        <tbody>
+            <tr>
+                <td>1</td>
+                <td>Ali Farag</td>
+                <td>12</td>
+                <td>20,000</td>
+            </tr>
+        </tbody>
+    </table>
+</html>
+"""
+
+
+def test_scrape_rankings_html_reuses_cached_page_on_304(tmp_path) -> None:
+    """Test that a cached page is revalidated and reused on 304 Not Modified."""
+    session = MagicMock()
+
+    first = Mock()
+    first.status_code = 200
+    first.text = RANKINGS_PAGE
+    first.headers = {"Last-Modified": "Tue, 14 Oct 2026 08:00:00 GMT", "ETag": '"v1"'}
+    first.raise_for_status = Mock()
+
+    not_modified = Mock()
+    not_modified.status_code = 304
+    not_modified.text = ""
+    not_modified.headers = {}
+    not_modified.raise_for_status = Mock()
+
+    session.get.side_effect = [first, not_modified]
+
+    fresh = scrape_rankings_html(session=session, cache_dir=tmp_path)
+    cached = scrape_rankings_html(session=session, cache_dir=tmp_path)
+
+    assert fresh == cached
+    assert cached[0]["player"] == "Ali Farag"
+    assert "headers" not in session.get.call_args_list[0].kwargs
+    assert session.get.call_args_list[1].kwargs["headers"] == {
+        "If-Modified-Since": "Tue, 14 Oct 2026 08:00:00 GMT",
+        "If-None-Match": '"v1"',
+    }
+
+
+def test_scrape_rankings_html_without_validators_is_not_cached(tmp_path) -> None:
+    """Test that pages without Last-Modified/ETag are neither cached nor revalidated."""
+    session = MagicMock()
+    response = Mock()
+    response.status_code = 200
+    response.text = RANKINGS_PAGE
+    response.headers = {}
+    response.raise_for_status = Mock()
+    session.get.return_value = response
+
+    scrape_rankings_html(session=session, cache_dir=tmp_path)
+    scrape_rankings_html(session=session, cache_dir=tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
+    assert all("headers" not in c.kwargs for c in session.get.call_args_list)
+
+
+def test_clear_html_cache_forces_full_fetch(tmp_path) -> None:
+    """Test that clearing the cache drops the page so the next request is unconditional."""
+    session = MagicMock()
+    response = Mock()
+    response.status_code = 200
+    response.text = RANKINGS_PAGE
+    response.headers = {"ETag": '"v1"'}
+    response.raise_for_status = Mock()
+    session.get.return_value = response
+
+    scrape_rankings_html(session=session, cache_dir=tmp_path)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "rankings_page.html",
+        "rankings_page.json",
+    ]
+
+    clear_html_cache(tmp_path)
+    assert list(tmp_path.iterdir()) == []
+
+    scrape_rankings_html(session=session, cache_dir=tmp_path)
+    assert "headers" not in session.get.call_args_list[1].kwargs
+
+
+def test_clear_html_cache_without_cache_is_noop(tmp_path) -> None:
+    """Test that clearing a cache that was never written does not raise."""
+    clear_html_cache(tmp_path / "missing")
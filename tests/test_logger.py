@@ -0,0 +1,105 @@
+"""
+Test suite for logger configuration.
+"""
+
+import logging
+import os
+import subprocess
+import sys
+
+from psa_squash_rankings.logger import (
+    configure_log_level,
+    get_logger,
+    skip_unused_record_fields,
+)
+
+
+def test_get_logger_configures_each_name_once() -> None:
+    """Test that repeated lookups reuse the logger without adding handlers."""
+    first = get_logger("psa_squash_rankings.tests.memo")
+    handler_count = len(first.handlers)
+
+    second = get_logger("psa_squash_rankings.tests.memo")
+
+    assert second is first
+    assert len(second.handlers) == handler_count
+
+
+def test_get_logger_keeps_adjusted_level() -> None:
+    """Test that a level changed after setup is not reset by later lookups."""
+    logger = get_logger("psa_squash_rankings.tests.level")
+    logger.setLevel(logging.DEBUG)
+
+    assert get_logger("psa_squash_rankings.tests.level").level == logging.DEBUG
+
+
+def test_loggers_share_one_log_file() -> None:
+    """Test that different loggers write through the same file handler."""
+    first = get_logger("psa_squash_rankings.tests.file_a")
+    second = get_logger("psa_squash_rankings.tests.file_b")
+
+    first_files = {
+        h.baseFilename for h in first.handlers if isinstance(h, logging.FileHandler)
+    }
+    second_files = {
+        h.baseFilename for h in second.handlers if isinstance(h, logging.FileHandler)
+    }
+
+    assert len(first_files) == 1
+    assert first_files == second_files
+
+
+def test_configure_log_level_applies_to_existing_and_new_loggers() -> None:
+    """Test that configure_log_level reaches cached loggers and later ones."""
+    existing = get_logger("psa_squash_rankings.tests.configure_existing")
+    try:
+        configure_log_level(logging.DEBUG)
+        created = get_logger("psa_squash_rankings.tests.configure_new")
+
+        assert existing.isEnabledFor(logging.DEBUG)
+        assert created.isEnabledFor(logging.DEBUG)
+    finally:
+        configure_log_level(logging.INFO)
+
+    assert not existing.isEnabledFor(logging.DEBUG)
+
+
+def test_skip_unused_record_fields_keeps_formatted_output(monkeypatch) -> None:
+    """Test that records still format fully without caller and thread info."""
+    for attr in ("_srcfile", "logThreads", "logProcesses", "logMultiprocessing"):
+        monkeypatch.setattr(logging, attr, getattr(logging, attr))
+    skip_unused_record_fields()
+
+    logger = get_logger("psa_squash_rankings.tests.record_fields")
+    record = logger.makeRecord(
+        logger.name, logging.INFO, "(unknown file)", 0, "page %d", (3,), None
+    )
+    formatted = logger.handlers[0].format(record)
+
+    assert formatted.endswith(
+        " - psa_squash_rankings.tests.record_fields - INFO - page 3"
+    )
+    assert record.thread is None
+    assert record.process is None
+
+
+def test_importing_package_creates_no_log_file(tmp_path) -> None:
+    """Test that the log directory and file only appear once a record is written."""
+    code = (
+        "import psa_squash_rankings.logger as log, os\n"
+        "import psa_squash_rankings\n"
+        "assert not os.path.exists('logs'), os.listdir('.')\n"
+        "log.get_logger('psa_squash_rankings.tests.lazy').info('hello')\n"
+        "print(open(log._LOG_FILE, encoding='utf-8').read())\n"
+    )
+    env = {**os.environ, "PSA_DATA_DIR": str(tmp_path)}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env=env,
+        check=True,
+    )
+
+    assert "INFO - hello" in result.stdout
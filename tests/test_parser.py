@@ -3,8 +3,8 @@ Test suite for data parser functionality.
 """
 
 import pytest
-from psa_squash_rankings.data_parser import parse_api_player
-from psa_squash_rankings.validator import validate_api_schema
+from psa_squash_rankings.data_parser import parse_api_player, parse_measure
+from psa_squash_rankings.validator import REQUIRED_API_FIELDS, validate_api_schema
 
 
 def test_validate_api_schema_success() -> None:
@@ -26,6 +26,40 @@ def test_validate_api_schema_failure() -> None:
         validate_api_schema(invalid_player)
 
 
+@pytest.mark.parametrize("field", sorted(REQUIRED_API_FIELDS))
+def test_validate_api_schema_detects_each_missing_field(field: str) -> None:
+    """Test that dropping any single required field fails validation."""
+    player = {
+        "World Ranking": 1,
+        "Name": "Ali Farag",
+        "Id": 12345,
+        "Tournaments": 12,
+        "Total Points": 20000,
+    }
+    del player[field]
+    with pytest.raises(ValueError, match=field):
+        validate_api_schema(player)
+
+
+def test_validate_api_schema_checks_required_fields_constant(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a field added to REQUIRED_API_FIELDS is enforced."""
+    monkeypatch.setattr(
+        "psa_squash_rankings.validator.REQUIRED_API_FIELDS",
+        REQUIRED_API_FIELDS | {"Country"},
+    )
+    player = {
+        "World Ranking": 1,
+        "Name": "Ali Farag",
+        "Id": 12345,
+        "Tournaments": 12,
+        "Total Points": 20000,
+    }
+    with pytest.raises(ValueError, match="Country"):
+        validate_api_schema(player)
+
+
 def test_parse_api_player_transformation() -> None:
     """Test that the parser correctly renames and converts fields."""
     raw_data = {
@@ -52,6 +86,23 @@ def test_parse_api_player_transformation() -> None:
     assert parsed["source"] == "api"
 
 
+def test_parse_api_player_coerces_string_numbers() -> None:
+    """Test that string-typed numeric fields are converted to int."""
+    raw_data = {
+        "World Ranking": 5,
+        "Name": "Mohamed ElShorbagy",
+        "Id": "12345",
+        "Tournaments": "10",
+        "Total Points": "15000",
+    }
+    parsed = parse_api_player(raw_data)
+
+    assert parsed["id"] == 12345
+    assert parsed["tournaments"] == 10
+    assert parsed["points"] == 15000
+    assert all(type(parsed[field]) is int for field in ("id", "tournaments", "points"))
+
+
 def test_parse_api_player_with_all_optional_fields() -> None:
     """Test that the parser correctly extracts all optional fields when present."""
     raw_data = {
@@ -151,3 +202,35 @@ def test_parse_api_player_missing_optional_fields() -> None:
     assert parsed["picture_url"] is None
     assert parsed["mugshot_url"] is None
     assert parsed["source"] == "api"
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("185cm", 185),
+        ("185 cm", 185),
+        ("75KG", 75),
+        ("185", 185),
+        (185, 185),
+        ("1.85cm", 185),
+        ("6' 1\"", 185),
+        ("72in", 183),
+        ("165lbs", 75),
+    ],
+)
+def test_parse_measure_formats(value: object, expected: int) -> None:
+    """Test that parse_measure handles metric, imperial and bare numeric values."""
+    assert parse_measure(value, "Height") == expected
+
+
+def test_parse_measure_empty_returns_none() -> None:
+    """Test that empty values are treated as missing."""
+    assert parse_measure("", "Height") is None
+    assert parse_measure("   ", "Height") is None
+    assert parse_measure(None, "Height") is None
+
+
+def test_parse_measure_no_digits_raises() -> None:
+    """Test that values without any digits raise a ValueError."""
+    with pytest.raises(ValueError, match="No numeric data"):
+        parse_measure("unknown cm", "Height")